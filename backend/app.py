@@ -1,6 +1,7 @@
-from flask import Flask, send_from_directory, request, make_response
-from flask_cors import CORS
 import os
+from flask import Flask, Request, send_from_directory, request, make_response
+from flask.json.provider import DefaultJSONProvider
+from flask_cors import CORS
 from dotenv import load_dotenv
 
 """App entrypoint.
@@ -18,7 +19,51 @@ load_dotenv()
 from routes.ai import ai_bp  # noqa: E402
 from routes.data import data_bp  # noqa: E402
 
-app = Flask(__name__)
+try:
+    import orjson
+except ImportError:  # fall back to Flask's stdlib-json provider
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Serialize responses with orjson.
+
+    The dashboard, statistics and chat payloads are large nested dicts full of
+    numpy scalars; orjson encodes those natively instead of calling back into
+    ``default`` per value. Anything else it doesn't know (dates, Decimal, UUID)
+    still goes through Flask's default handler.
+    """
+
+    _options = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    @staticmethod
+    def _fallback(obj):
+        if hasattr(obj, 'item'):  # numpy scalar types orjson doesn't cover
+            return obj.item()
+        return DefaultJSONProvider.default(obj)
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self._fallback, option=self._options).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class UploadRequest(Request):
+    # File parts already spool to a temp file once they pass 500KB; this caps
+    # the plain (non-file) form fields that werkzeug would keep in memory.
+    max_form_memory_size = 1024 * 1024
+
+# No built-in /static view: serve_static below is the only one, and with
+# SERVE_STATIC=False nothing in Python serves those files
+app = Flask(__name__, static_folder=None)
+app.request_class = UploadRequest
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
+# Uploads, charts and TTS audio are written here; create it under any server,
+# not just `python app.py`
+os.makedirs('static', exist_ok=True)
 
 # Configure CORS
 cors_origins_env = os.getenv('CORS_ORIGINS', '*')
@@ -30,19 +75,48 @@ if cors_origins_env != '*':
 else:
     cors_origins = list(default_origins)
 
-CORS(app, resources={r"/api/*": {"origins": cors_origins}}, supports_credentials=True)
+# Let browsers cache preflight results; Chrome caps this at 10 minutes.
+CORS_MAX_AGE = 600
+
+CORS(app, resources={r"/api/*": {"origins": cors_origins}}, max_age=CORS_MAX_AGE, supports_credentials=True)
+
+# Resolved once for the after_request hook: O(1) membership per response
+_cors_origin_set = frozenset(cors_origins)
+_cors_allow_any = '*' in cors_origins_env
+
+# Origin-independent CORS headers, built once
+_CORS_HEADERS = {
+    'Vary': 'Origin',
+    'Access-Control-Allow-Credentials': 'true',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+}
+_PREFLIGHT_HEADERS = {**_CORS_HEADERS, 'Access-Control-Max-Age': str(CORS_MAX_AGE)}
+
+@app.before_request
+def short_circuit_preflight():
+    """Answer every OPTIONS preflight with an empty 204 before URL dispatch.
+
+    add_cors_headers still runs on this response and attaches the
+    origin-specific headers.
+    """
+    if request.method == 'OPTIONS':
+        return make_response('', 204)
 
 @app.after_request
 def add_cors_headers(response):
     origin = request.headers.get('Origin')
-    if origin and (origin in cors_origins or '*' in cors_origins_env):
+    if origin and (_cors_allow_any or origin in _cors_origin_set):
         response.headers['Access-Control-Allow-Origin'] = origin
-        response.headers['Vary'] = 'Origin'
-        response.headers['Access-Control-Allow-Credentials'] = 'true'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization'
-        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
+        response.headers.update(_PREFLIGHT_HEADERS if request.method == 'OPTIONS' else _CORS_HEADERS)
     return response
 
+# Hand file delivery to the front server via X-Sendfile when it supports it
+# (Apache mod_xsendfile, lighttpd). Leave off otherwise: Flask then sends an
+# empty body and relies on the proxy to fill it in. Without it, send_file
+# still uses the server's wsgi.file_wrapper, which Gunicorn maps to sendfile(2).
+app.use_x_sendfile = os.getenv('USE_X_SENDFILE', 'False').lower() == 'true'
+
 # Configure upload settings
 app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_CONTENT_LENGTH', 52428800))  # 50MB
 
@@ -66,15 +140,22 @@ def index():
 def health():
     return {'status': 'healthy', 'timestamp': os.getenv('TIMESTAMP', 'unknown')}
 
-@app.route('/static/<filename>')
-def serve_static(filename):
-    """Serve static files (charts, audio)"""
-    return send_from_directory('static', filename)
+# When Nginx fronts the app it serves /static/ from disk (see frontend/nginx.conf);
+# set SERVE_STATIC=False there so Python never streams those files.
+if os.getenv('SERVE_STATIC', 'True').lower() == 'true':
+    @app.route('/static/<filename>')
+    def serve_static(filename):
+        """Serve static files (charts, audio)
+
+        Generated filenames are unique per render, so a given URL never changes
+        content and clients may cache it; send_file adds the ETag and
+        Last-Modified validators for revalidation.
+        """
+        response = send_from_directory('static', filename, conditional=True, etag=True, max_age=3600)
+        response.headers['Cache-Control'] = 'public, max-age=3600, immutable'
+        return response
 
 if __name__ == '__main__':
-    # Ensure static directory exists
-    os.makedirs('static', exist_ok=True)
-    
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
     
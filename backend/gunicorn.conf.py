@@ -0,0 +1,35 @@
+"""Gunicorn configuration for production deployments.
+
+The AI and data endpoints spend most of their time waiting on upstream calls
+(Gemini, gTTS), so the worker runs on gevent: a request blocked on the network
+yields and the same process keeps serving up to ``worker_connections`` others.
+If gevent isn't available, set ``GUNICORN_WORKER_CLASS=gthread`` to fall back
+to a pool of ``threads`` per worker.
+
+Every setting can be overridden through the environment, e.g.
+``GUNICORN_WORKER_CONNECTIONS=2000 gunicorn -c gunicorn.conf.py app:app``.
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# The uploaded dataset lives in process memory (DataService.current_data), so a
+# second worker would not see it. Scale with connections/threads, not workers.
+workers = int(os.getenv('GUNICORN_WORKERS', 1))
+# The gevent worker monkey-patches the stdlib itself before it loads the app
+# (preload_app stays off), so app.py doesn't patch anything
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gevent')
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+threads = int(os.getenv('GUNICORN_THREADS', 16))
+
+# Gemini calls use a 30s client timeout; leave headroom for analysis + TTS.
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 120))
+graceful_timeout = 30
+
+# The voice UI chains many small calls (/chat, /tts, /status); keep client
+# connections open between them. Matches Nginx's keepalive_timeout.
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 65))
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
@@ -1,33 +1,30 @@
 from flask import Blueprint, request, jsonify
-from services.gemini_service import GeminiService
-from services.tts_service import TTSService
-from services.data_service import DataService
+from services.registry import (
+    get_data_service as _shared_ds,
+    get_gemini_service as _gemini,
+    get_tts_service as _tts,
+)
 import os
 import logging
 
 ai_bp = Blueprint('ai', __name__)
-gemini_service = GeminiService()
-tts_service = TTSService()
-# Try to reuse the shared DataService instance created in routes/data.py
-try:
-    from routes.data import data_service as shared_data_service  # type: ignore
-    _shared_ds = shared_data_service
-except Exception:
-    _shared_ds = DataService()
+
+# Frontend message `type` -> speaker label in the prompt; other types are skipped
+_ROLE_LABELS = {'user': 'User', 'assistant': 'Assistant'}
 
 @ai_bp.route('/process', methods=['POST'])
 def process():
     """Process user input with Gemini AI"""
     try:
-        data = request.get_json()
-        if not data or 'message' not in data:
+        data = request.get_json(silent=True) or {}
+        if 'message' not in data:
             return jsonify({'success': False, 'error': 'No message provided'}), 400
         
         message = data['message']
         context = data.get('context', '')
         
         # Get AI response
-        result = gemini_service.generate_response(message, context)
+        result = _gemini().generate_response(message, context)
         
         if 'error' in result:
             return jsonify({'success': False, **result}), 500
@@ -40,7 +37,7 @@ def process():
         
         # Generate TTS if requested
         if data.get('generate_audio', False):
-            audio_file = tts_service.generate_speech(result['response'])
+            audio_file = _tts().generate_speech(result['response'])
             if audio_file:
                 response_data['audio_url'] = f"/static/{audio_file}"
         return jsonify({'success': True, **response_data})
@@ -71,32 +68,24 @@ def chat():
         
         # If we have data loaded, add data-specific context
         if data_context and 'success' in data_context:
-            data_service = _shared_ds
+            data_service = _shared_ds()
             # Get rich data context safely
             try:
-                analysis_context['data_summary'] = data_service.get_brief_summary()
-                analysis_context['data_profile'] = data_service.get_data_profile()
-                analysis_context['column_summaries'] = data_service.get_column_summaries()
+                bundle = data_service.get_cached_context_bundle()
+                analysis_context['data_summary'] = bundle['data_summary']
+                analysis_context['data_profile'] = bundle['data_profile']
+                analysis_context['column_summaries'] = bundle['column_summaries']
                 analysis_context['suggested_analyses'] = data_service.suggest_analyses(message)
             except Exception:
                 pass
 
-        conversation_history = data.get('history', [])
-
-        # Build context from the last few messages (map frontend schema: type=user/assistant, content)
-        history_window = conversation_history[-8:] if conversation_history else []
-        context_lines = []
-        for m in history_window:
-            role = m.get('type')
-            content = (m.get('content') or '').strip()
-            if not content:
-                continue
-            if role == 'user':
-                context_lines.append(f"User: {content}")
-            elif role == 'assistant':
-                context_lines.append(f"Assistant: {content}")
-
-        context = "\n".join(context_lines[-12:])  # cap lines to avoid runaway context
+        # Build context from the last few messages (map frontend schema: type=user/assistant, content).
+        # Slicing first bounds the work to 8 messages, so no cap is needed afterwards.
+        context = "\n".join(
+            f"{_ROLE_LABELS[m.get('type')]}: {content}"
+            for m in (history or [])[-8:]
+            if m.get('type') in _ROLE_LABELS and (content := (m.get('content') or '').strip())
+        )
         if context:
             context = f"Conversation so far (most recent last):\n{context}\n---\n"
         
@@ -105,12 +94,12 @@ def chat():
         # into new browser sessions.
         try:
             if data_context and data_context.get('success'):
-                dataset_context = _shared_ds.get_ai_dataset_context()
+                dataset_context = _shared_ds().get_cached_context_bundle()['dataset_context']
                 context += f"\nCurrent Dataset Context:\n{dataset_context}\n---\n"
         except Exception:
             pass  # Continue without dataset context if there's an error
 
-        result = gemini_service.generate_response(message, context)
+        result = _gemini().generate_response(message, context)
 
         if 'error' in result:
             # Differentiate upstream (Gemini) errors vs local validation
@@ -135,14 +124,14 @@ def chat():
 def tts():
     """Generate text-to-speech audio"""
     try:
-        data = request.get_json()
-        if not data or 'text' not in data:
+        data = request.get_json(silent=True) or {}
+        if 'text' not in data:
             return jsonify({'success': False, 'error': 'No text provided'}), 400
         
         text = data['text']
         language = data.get('lang', 'en')
         
-        audio_file = tts_service.generate_speech(text, language)
+        audio_file = _tts().generate_speech(text, language)
         
         if audio_file:
             return jsonify({
@@ -156,13 +145,11 @@ def tts():
     except Exception as e:
         return jsonify({'success': False, 'error': f'TTS failed: {str(e)}'}), 500
 
-@ai_bp.route('/status', methods=['GET', 'OPTIONS'])
+@ai_bp.route('/status', methods=['GET'])
 def status():
-    if request.method == 'OPTIONS':
-        return ('', 204)
     """AI service health check (lightweight)"""
     api_key_ok = bool(os.getenv('GEMINI_API_KEY'))
-    model_status = gemini_service.get_model_status()
+    model_status = _gemini().get_model_status()
     
     return jsonify({
         'success': True,
@@ -181,15 +168,15 @@ def model():
     if request.method == 'GET':
         return jsonify({
             'success': True,
-            **gemini_service.get_model_status()
+            **_gemini().get_model_status()
         })
     
     try:
-        data = request.get_json()
-        if not data or 'model' not in data:
+        data = request.get_json(silent=True) or {}
+        if 'model' not in data:
             return jsonify({'success': False, 'error': 'No model specified'}), 400
         
-        result = gemini_service.set_model(data['model'])
+        result = _gemini().set_model(data['model'])
         if result['success']:
             return jsonify({'success': True, **result})
         else:
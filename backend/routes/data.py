@@ -1,23 +1,21 @@
 from flask import Blueprint, request, jsonify, current_app
 from werkzeug.utils import secure_filename
-from services.data_service import DataService
-from services.gemini_service import GeminiService
+from services.registry import get_data_service as _data_service, get_gemini_service as _gemini
 import os
-import uuid
+import secrets
+import shutil
 
 data_bp = Blueprint('data', __name__)
-data_service = DataService()
-gemini_service = GeminiService()
 
-ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls'}
-
-def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+ALLOWED_EXTENSIONS = frozenset({'.csv', '.xlsx', '.xls'})
+UPLOAD_COPY_BUFFER = 1024 * 1024  # 1MB chunks when writing uploads to disk
+MAX_PAGE_ROWS = 5000  # Upper bound for /rows?limit=
 
 @data_bp.route('/quality', methods=['GET'])
 def get_data_quality():
     """Get data quality metrics"""
     try:
+        data_service = _data_service()
         quality_metrics = data_service.get_data_quality()
         return jsonify({'success': True, 'quality': quality_metrics})
     except Exception as e:
@@ -27,6 +25,7 @@ def get_data_quality():
 def get_summary_stats():
     """Get summary statistics"""
     try:
+        data_service = _data_service()
         if data_service.current_data is None:
             return jsonify({'success': False, 'error': 'No data loaded'}), 400
         summary = data_service.get_summary_stats()
@@ -38,10 +37,11 @@ def get_summary_stats():
 def get_visualization_data():
     """Get data for visualization"""
     try:
+        data_service = _data_service()
         if data_service.current_data is None:
             return jsonify({'success': False, 'error': 'No data loaded'}), 400
             
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         columns = data.get('columns', [])
         
         if not columns:
@@ -62,6 +62,7 @@ def get_visualization_data():
 def upload():
     """Handle file upload and initial analysis"""
     try:
+        data_service = _data_service()
         if 'file' not in request.files:
             return jsonify({'error': 'No file provided'}), 400
         
@@ -69,20 +70,24 @@ def upload():
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        if not allowed_file(file.filename):
+        # Parse the extension once; it doubles as the loader's file type
+        ext = os.path.splitext(file.filename)[1].lower()
+        if ext not in ALLOWED_EXTENSIONS:
             return jsonify({'error': 'File type not supported. Use CSV or Excel files.'}), 400
         
         # Save uploaded file
         filename = secure_filename(file.filename)
-        unique_filename = f"{uuid.uuid4().hex[:8]}_{filename}"
+        # Uploads are served from /static with immutable caching, so the
+        # prefix must be unguessable and never repeat across restarts
+        unique_filename = f"{secrets.token_hex(8)}_{filename}"
         filepath = os.path.join('static', unique_filename)
-        file.save(filepath)
-        
-        # Determine file type
-        file_type = filename.rsplit('.', 1)[1].lower()
+        # Stream the (already disk-spooled) upload across in large chunks so
+        # peak memory stays flat regardless of MAX_CONTENT_LENGTH
+        with open(filepath, 'wb', buffering=UPLOAD_COPY_BUFFER) as out:
+            shutil.copyfileobj(file.stream, out, length=UPLOAD_COPY_BUFFER)
         
         # Load and analyze data
-        result = data_service.load_data(filepath, file_type)
+        result = data_service.load_data(filepath, ext[1:])
         
         if 'error' in result:
             # Clean up uploaded file
@@ -92,8 +97,9 @@ def upload():
         
         # Get all the necessary data
         dashboard = data_service.get_analytics_dashboard()
-        ai_context = data_service.get_ai_dataset_context()
-        brief_summary = data_service.get_brief_summary()
+        context_bundle = data_service.get_cached_context_bundle()
+        ai_context = context_bundle['dataset_context']
+        brief_summary = context_bundle['data_summary']
         
         # Merge all data together
         complete_result = {
@@ -115,12 +121,28 @@ def upload():
             os.remove(filepath)
         return jsonify({'error': f'Upload failed: {str(e)}'}), 500
 
+@data_bp.route('/rows', methods=['GET'])
+def rows():
+    """Return a page of dataset rows (?offset=&limit=)"""
+    try:
+        data_service = _data_service()
+        if data_service.current_data is None:
+            return jsonify({'success': False, 'error': 'No data loaded'}), 400
+        
+        offset = request.args.get('offset', 0, type=int)
+        limit = max(0, min(request.args.get('limit', data_service.PREVIEW_ROWS, type=int), MAX_PAGE_ROWS))
+        return jsonify({'success': True, **data_service.get_page(offset, limit)})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @data_bp.route('/query', methods=['POST'])
 def query():
     """Process natural language data queries"""
     try:
-        data = request.get_json()
-        if not data or 'query' not in data:
+        data_service = _data_service()
+        gemini_service = _gemini()
+        data = request.get_json(silent=True) or {}
+        if 'query' not in data:
             return jsonify({'error': 'No query provided'}), 400
         
         user_query = data['query']
@@ -155,6 +177,7 @@ def query():
 def info():
     """Return current dataset information"""
     try:
+        data_service = _data_service()
         if data_service.current_data is None:
             return jsonify({
                 'loaded': False,
@@ -175,6 +198,8 @@ def info():
 def insights():
     """Generate automated data insights"""
     try:
+        data_service = _data_service()
+        gemini_service = _gemini()
         if data_service.current_data is None:
             return jsonify({'error': 'No dataset loaded'}), 400
         
@@ -203,6 +228,7 @@ def insights():
 def suggestions():
     """Get query suggestions based on current dataset"""
     try:
+        data_service = _data_service()
         if data_service.current_data is None:
             return jsonify({
                 'suggestions': [
@@ -245,6 +271,7 @@ def suggestions():
 def analytics_dashboard():
     """Get comprehensive analytics dashboard"""
     try:
+        data_service = _data_service()
         if data_service.current_data is None:
             return jsonify({'error': 'No dataset loaded'}), 400
         
@@ -261,10 +288,11 @@ def analytics_dashboard():
 def ai_context():
     """Get AI-readable dataset context"""
     try:
+        data_service = _data_service()
         if data_service.current_data is None:
             return jsonify({'error': 'No dataset loaded'}), 400
         
-        context = data_service.get_ai_dataset_context()
+        context = data_service.get_cached_context_bundle()['dataset_context']
         return jsonify({
             'success': True,
             'context': context
@@ -277,8 +305,9 @@ def ai_context():
 def ai_query():
     """Process AI queries about the dataset"""
     try:
-        data = request.get_json()
-        if not data or 'question' not in data:
+        data_service = _data_service()
+        data = request.get_json(silent=True) or {}
+        if 'question' not in data:
             return jsonify({'error': 'No question provided'}), 400
         
         result = data_service.query_dataset_for_ai(data['question'])
@@ -294,6 +323,7 @@ def ai_query():
 def statistics():
     """Get detailed statistics for all columns"""
     try:
+        data_service = _data_service()
         if data_service.current_data is None:
             return jsonify({'error': 'No dataset loaded'}), 400
         
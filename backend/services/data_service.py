@@ -3,6 +3,7 @@ import numpy as np
 import matplotlib
 matplotlib.use('Agg')  # Use non-GUI backend
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import plotly.express as px
 import plotly.graph_objects as go
 import plotly.utils
@@ -10,12 +11,18 @@ import seaborn as sns
 from services.mixins.serialization_mixin import SerializationMixin
 import os
 import json
+import hashlib
+import pickle
+import tempfile
 from io import StringIO
 from typing import Dict, Any, Tuple, Optional, List
 import uuid
 from datetime import datetime
 import re
-from collections import defaultdict
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from collections import defaultdict, deque
 from scipy import stats
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
@@ -27,15 +34,176 @@ warnings.filterwarnings('ignore')
 plt.style.use('dark_background')
 sns.set_theme(style="darkgrid", palette="viridis")
 
+# The PNG chart helpers all draw into this one Figure; clearing it between
+# charts is cheaper than creating and closing a pyplot figure per chart. The
+# lock serializes rendering so analyses running on different threads can't
+# draw into each other's charts.
+_PLOT_LOCK = threading.Lock()
+_PNG_FIGURE = Figure()
+
+def _png_axes(figsize):
+    """Clear the shared PNG figure, resize it and return a fresh Axes"""
+    _PNG_FIGURE.clf()
+    _PNG_FIGURE.set_size_inches(figsize)
+    return _PNG_FIGURE.add_subplot()
+
+# PNG rendering is CPU-bound and holds the GIL. With CHART_RENDER_PROCESSES > 0
+# the _draw_* functions run in that many spawned processes (each with its own
+# figure), so concurrent queries render in parallel. 0 renders inline.
+_CHART_RENDER_PROCESSES = int(os.getenv('CHART_RENDER_PROCESSES', '0'))
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+def _render_png(draw, filepath, *args):
+    """Run a _draw_* function inline or on the render process pool and wait for it"""
+    global _render_pool
+    if _CHART_RENDER_PROCESSES <= 0:
+        return draw(filepath, *args)
+    with _render_pool_lock:
+        if _render_pool is None:  # created on first use, not at import (gunicorn forks after import)
+            _render_pool = ProcessPoolExecutor(max_workers=_CHART_RENDER_PROCESSES,
+                                               mp_context=multiprocessing.get_context('spawn'))
+    return _render_pool.submit(draw, filepath, *args).result()
+
+def _draw_bar_chart(filepath, x, y, title, xlabel, ylabel):
+    with _PLOT_LOCK:
+        ax = _png_axes((10, 6))
+        ax.bar(x, y, color='#00ff9f', alpha=0.7)
+        ax.set_title(title, color='white', fontsize=16)
+        ax.set_xlabel(xlabel, color='white')
+        ax.set_ylabel(ylabel, color='white')
+        ax.tick_params(axis='x', labelrotation=45, colors='white')
+        ax.tick_params(axis='y', colors='white')
+        ax.grid(True, alpha=0.3)
+        _PNG_FIGURE.tight_layout()
+        _PNG_FIGURE.savefig(filepath, facecolor='#1a1a2e', dpi=150)
+
+def _draw_line_chart(filepath, x, y, title, xlabel, ylabel):
+    with _PLOT_LOCK:
+        ax = _png_axes((10, 6))
+        ax.plot(x, y, color='#00ff9f', linewidth=2, marker='o', markersize=4)
+        ax.set_title(title, color='white', fontsize=16)
+        ax.set_xlabel(xlabel, color='white')
+        ax.set_ylabel(ylabel, color='white')
+        ax.tick_params(colors='white')
+        ax.grid(True, alpha=0.3)
+        _PNG_FIGURE.tight_layout()
+        _PNG_FIGURE.savefig(filepath, facecolor='#1a1a2e', dpi=150)
+
+def _draw_correlation_heatmap(filepath, corr_matrix):
+    with _PLOT_LOCK:
+        ax = _png_axes((10, 8))
+        sns.heatmap(corr_matrix, annot=True, cmap='viridis', center=0,
+                   square=True, linewidths=0.5, cbar_kws={"shrink": .5}, ax=ax)
+        ax.set_title('Correlation Matrix', color='white', fontsize=16)
+        _PNG_FIGURE.tight_layout()
+        _PNG_FIGURE.savefig(filepath, facecolor='#1a1a2e', dpi=150)
+
+def _draw_histogram(filepath, counts, edges, column_name):
+    with _PLOT_LOCK:
+        ax = _png_axes((10, 6))
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+               color='#00ff9f', alpha=0.7, edgecolor='white')
+        ax.set_title(f'Distribution of {column_name}', color='white', fontsize=16)
+        ax.set_xlabel(column_name, color='white')
+        ax.set_ylabel('Frequency', color='white')
+        ax.tick_params(colors='white')
+        ax.grid(True, alpha=0.3)
+        _PNG_FIGURE.tight_layout()
+        _PNG_FIGURE.savefig(filepath, facecolor='#1a1a2e', dpi=150)
+
+def _plotly_bar_json(x, y, title, **trace):
+    """Plotly figure JSON for a single bar trace in the dashboard's transparent theme.
+
+    Equivalent to px.bar(...).update_layout(...).to_json() for the dashboard
+    charts, without building and validating a Figure object. Extra keyword
+    arguments go on the trace.
+    """
+    return json.dumps({
+        "data": [{"type": "bar", "x": x, "y": y, **trace}],
+        "layout": {
+            "title": {"text": title},
+            "plot_bgcolor": "rgba(0,0,0,0)",
+            "paper_bgcolor": "rgba(0,0,0,0)",
+            "font": {"color": "white"},
+        },
+    }, default=str)
+
+# Percentiles computed for every numeric column by DataService._profile
+_PROFILE_PERCENTILES = [.01, .05, .1, .25, .5, .75, .9, .95, .99]
+
+# Leading YYYY-MM-DD, MM/DD/YYYY or MM-DD-YYYY; used by _detect_date_columns
+_DATE_PREFIX_RE = re.compile(r'\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}|\d{2}-\d{2}-\d{4}')
+
+# Column-name keyword checks for _detect_data_patterns. Matched as substrings
+# (so 'zip' also hits 'zipcode') against the newline-joined lowercased names.
+_IDENTIFIER_RE = re.compile(r'_id|^id$', re.MULTILINE)
+_GEO_KEYWORDS_RE = re.compile('country|state|city|region|latitude|longitude|lat|lng|zip')
+_FINANCE_KEYWORDS_RE = re.compile('price|cost|revenue|profit|sales|amount|value')
+
+# Column-name keywords behind _infer_dataset_type, same matching; first hit wins
+_DATASET_TYPE_PATTERNS = (
+    ('sales_data', re.compile('sales|revenue|price|amount')),
+    ('hr_data', re.compile('employee|staff|hr|salary')),
+    ('web_analytics', re.compile('traffic|visits|pageviews|clicks')),
+    ('weather_data', re.compile('temperature|humidity|weather')),
+    ('financial_data', re.compile('stock|market|trading')),
+)
+
+# Rule-based query intents for process_query, in priority order: the first
+# pattern found anywhere in the lowercased query picks the handler method.
+# Substring semantics, like the keyword lists they replace.
+_QUERY_INTENTS = (
+    (re.compile('average|mean|avg'), '_calculate_averages'),
+    (re.compile('correlation|correlate|relationship'), '_analyze_correlation'),
+    (re.compile('trend|trends|time|over time'), '_analyze_trends'),
+    (re.compile('distribution|histogram|spread'), '_analyze_distribution'),
+    (re.compile('summary|describe|overview'), '_general_analysis'),  # _generate_summary behind the (query) signature
+    (re.compile('compare|comparison|vs|versus'), '_compare_data'),
+    (re.compile('top|highest|largest|maximum'), '_find_top_values'),
+    (re.compile('bottom|lowest|smallest|minimum'), '_find_bottom_values'),
+)
+
+# Intent tags attached to AI query results by _analyze_query_intent; unlike
+# _QUERY_INTENTS every matching tag is reported, in this order
+_QUERY_CONTEXT_INTENTS = (
+    ('trend', re.compile('trend|over time')),
+    ('correlation', re.compile('correl')),
+    ('statistics', re.compile('average|mean|median')),
+    ('anomaly', re.compile('outlier|anomal|unusual')),
+)
+
 class DataService(SerializationMixin):
+    # Rows returned inline by load_data; the rest are fetched with get_page
+    PREVIEW_ROWS = 500
+    # Most recent analysis_history entries kept; older ones are dropped
+    HISTORY_LIMIT = 100
+
     def __init__(self, static_dir: str = 'static'):
         self.static_dir = static_dir
+        # 'compact' downcasts numeric columns on load (float32, smallest int);
+        # the default 'full' keeps pandas' 64-bit dtypes
+        self.precision_mode = os.getenv('DATA_PRECISION_MODE', 'full').lower()
         self.current_data = None
         self.data_info = {}
         self.data_context = {}  # Store context about the data
-        self.analysis_history = []  # Track previous analyses
+        self.analysis_history = deque(maxlen=self.HISTORY_LIMIT)  # Track previous analyses
         self.column_meanings = {}  # AI-inferred column meanings
-        self.insights_cache = {}  # Cache AI insights
+        self.insights_cache = {}  # Comprehensive AI insights keyed by fingerprint
+        self._data_fingerprint = None  # Content hash of current_data, set on load
+        self._context_cache = {}  # Chat context bundles keyed by fingerprint
+        self._profile_cache = {}  # Per-column statistics frame keyed by fingerprint
+        self._corr_cache = {}  # Numeric correlation matrix keyed by fingerprint
+        self._value_counts_cache = {}  # Fingerprint -> {column: value_counts()}
+        self._outlier_cache = {}  # IQR outlier summaries keyed by fingerprint
+        self._row_stats_cache = {}  # Complete/duplicate row counts keyed by fingerprint
+        self._correlation_analysis_cache = {}  # _analyze_correlation result (incl. heatmap PNG) keyed by fingerprint
+        self._summary_analysis_cache = {}  # _generate_summary result (incl. bar chart PNG) keyed by fingerprint
+        self._dashboard_cache = {}  # Full analytics dashboard keyed by fingerprint
+        self._num_cols = []  # Numeric column names, set by _index_column_types
+        self._cat_cols = []  # Object (categorical) column names
+        self._column_terms = []  # (column, lowercased name, name words) for query matching
+        self._dataset_type = "unknown"  # _infer_dataset_type's answer for the loaded columns
     
     # ----------------------------
     # Public helpers expected by routes/ai.py
@@ -81,6 +249,370 @@ class DataService(SerializationMixin):
             summaries[col] = self._get_column_detailed_info(col)
         return self._json_safe(summaries)
 
+    def get_cached_context_bundle(self) -> Dict[str, Any]:
+        """Return the dataset-derived chat context, computed once per dataset.
+
+        Bundles get_brief_summary, get_data_profile, get_column_summaries and
+        get_ai_dataset_context. They only depend on the loaded data, so repeated
+        chat turns over the same dataset reuse the result instead of re-scanning it.
+        """
+        key = self._data_fingerprint
+        if key is not None and key in self._context_cache:
+            return self._context_cache[key]
+
+        bundle = {
+            'data_summary': self.get_brief_summary(),
+            'data_profile': self.get_data_profile(),
+            'column_summaries': self.get_column_summaries(),
+            'dataset_context': self.get_ai_dataset_context(),
+        }
+        if key is not None:
+            self._context_cache = {key: bundle}  # Only the current dataset is ever served
+        return bundle
+
+    def _compute_fingerprint(self) -> Optional[str]:
+        """Cheap content hash of current_data used to key dataset-level caches"""
+        if self.current_data is None:
+            return None
+        try:
+            hashed = pd.util.hash_pandas_object(self.current_data, index=True).values
+            return hashlib.blake2b(hashed.tobytes(), digest_size=8).hexdigest()
+        except TypeError:
+            # Unhashable cell values (e.g. lists from Excel); treat every load as new
+            return uuid.uuid4().hex
+
+    @staticmethod
+    def _first_non_null(series: pd.Series, k: int, distinct: bool = False) -> list:
+        """First k non-null values of series (first k distinct ones if `distinct`).
+
+        Same as series.dropna().head(k) / .dropna().unique()[:k], but reads the
+        column in small slices and stops once it has k values instead of
+        copying every non-null value first.
+        """
+        values = {} if distinct else []
+        for start in range(0, len(series), 256):
+            chunk = series.iloc[start:start + 256].dropna().tolist()
+            if distinct:
+                values.update(dict.fromkeys(chunk))
+            else:
+                values.extend(chunk)
+            if len(values) >= k:
+                break
+        return list(values)[:k]
+
+    @staticmethod
+    def _linear_slope(y: np.ndarray) -> float:
+        """Least-squares slope of y against its positions 0..n-1.
+
+        Closed form of np.polyfit(arange(n), y, 1)[0]: with x centred its sum
+        is zero, so the slope is (xc . y) / (xc . xc), and xc . xc is n(n^2-1)/12.
+        """
+        n = len(y)
+        xc = np.arange(n, dtype=np.float64) - (n - 1) / 2.0
+        return float(xc @ y / (n * (n * n - 1) / 12.0))
+
+    @staticmethod
+    def _is_int_or_float(dtype) -> bool:
+        """True for signed/unsigned integer and float dtypes of any width"""
+        return getattr(dtype, 'kind', None) in ('i', 'u', 'f')
+
+    def _downcast_numeric(self) -> None:
+        """Shrink numeric columns to the narrowest dtype that holds their values.
+
+        Halves (or better) the bytes every describe/corr/quantile pass has to
+        stream, at the cost of float32 precision. Only used in compact mode.
+
+        The target dtypes are picked from one frame-level min/max pass and
+        applied with a single astype, rather than letting pd.to_numeric rescan
+        each column for its own range.
+        """
+        df = self.current_data
+        numeric = df.select_dtypes(include=['floating', 'integer'])
+        if not len(numeric.columns):
+            return
+        bounds = numeric.agg(['min', 'max'])
+        targets = {}
+        for col, dtype in numeric.dtypes.items():
+            lo, hi = bounds.at['min', col], bounds.at['max', col]
+            if dtype.kind == 'f':
+                limit = np.finfo(np.float32).max
+                if dtype.itemsize > 4 and not (abs(lo) > limit or abs(hi) > limit):  # NaN bounds compare False
+                    targets[col] = np.float32
+                continue
+            for candidate in ((np.uint8, np.uint16, np.uint32) if dtype.kind == 'u' else (np.int8, np.int16, np.int32)):
+                info = np.iinfo(candidate)
+                if candidate(0).itemsize >= dtype.itemsize:
+                    break
+                if info.min <= lo and hi <= info.max:
+                    targets[col] = candidate
+                    break
+        if targets:
+            cols = list(targets)
+            df[cols] = numeric[cols].astype(targets)
+
+    def _index_column_types(self) -> None:
+        """Classify columns once per load.
+
+        select_dtypes walks every column's dtype on each call and was called
+        dozens of times per dashboard; the analysis helpers read these lists
+        instead (treat them as read-only).
+        """
+        self._num_cols = self.current_data.select_dtypes(include=[np.number]).columns.tolist()
+        self._cat_cols = self.current_data.select_dtypes(include=['object']).columns.tolist()
+        self._column_terms = [
+            (col, col.lower(), frozenset(col.lower().replace('_', ' ').split()))
+            for col in self.current_data.columns
+        ]
+        names = '\n'.join(lower for _, lower, _ in self._column_terms)
+        self._dataset_type = next(
+            (name for name, pattern in _DATASET_TYPE_PATTERNS if pattern.search(names)), "general_data"
+        )
+
+    def _profile(self) -> pd.DataFrame:
+        """Per-column statistics for current_data, computed once per dataset.
+
+        One frame-level call per metric (describe, sum, isnull, nunique,
+        memory_usage, plus one shared moment pass for skew/kurt) replaces the
+        per-column min/max/mean/... scans the summary, quality and dashboard
+        methods used to run on their own. Indexed by column name;
+        numeric-only fields are NaN for other columns. Percentile columns are
+        describe's labels ('1%', '25%', '50%', ...).
+        """
+        key = self._data_fingerprint
+        if key is not None and key in self._profile_cache:
+            return self._profile_cache[key]
+
+        df = self.current_data
+        numeric = df[self._num_cols]
+        if len(numeric.columns):
+            profile = numeric.describe(percentiles=_PROFILE_PERCENTILES).T.reindex(df.columns)
+        else:
+            profile = pd.DataFrame(index=df.columns)
+        profile['sum'] = numeric.sum()
+        profile['missing'] = df.isnull().sum()
+        profile['nunique'] = df.nunique()
+        if len(numeric.columns):
+            profile['skew'], profile['kurt'] = self._skew_kurt(numeric, profile.loc[numeric.columns])
+        else:
+            profile['skew'] = profile['kurt'] = np.nan
+        profile['dtype'] = df.dtypes.astype(str)
+        # deep=True sizes the Python strings behind object columns; the shallow
+        # figure only counts their 8-byte pointers
+        profile['memory_bytes'] = df.memory_usage(deep=True, index=False)
+
+        if key is not None:
+            self._profile_cache = {key: profile}
+        return profile
+
+    def _row_stats(self) -> Dict[str, int]:
+        """Row-level counts (complete rows, duplicate rows), computed once per dataset"""
+        key = self._data_fingerprint
+        if key is not None and key in self._row_stats_cache:
+            return self._row_stats_cache[key]
+
+        row_stats = {
+            "complete_rows": int(self.current_data.notna().all(axis=1).sum()),
+            "duplicate_rows": int(self.current_data.duplicated().sum()),
+        }
+        if key is not None:
+            self._row_stats_cache = {key: row_stats}
+        return row_stats
+
+    def _missing_percentage(self) -> float:
+        """Share of all cells that are missing, from the profile's per-column null counts"""
+        cells = self.current_data.size
+        return float(self._profile()['missing'].sum() / cells * 100) if cells else 0.0
+
+    @staticmethod
+    def _skew_kurt(numeric: pd.DataFrame, described: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+        """Bias-corrected skewness and excess kurtosis, as Series.skew()/kurt() give.
+
+        Both come from the same centred block (deviations from describe's
+        mean), so the data is centred once instead of once per statistic.
+        """
+        n = described['count'].to_numpy(dtype=np.float64)
+        d = numeric.to_numpy(dtype=np.float64) - described['mean'].to_numpy(dtype=np.float64)
+        d2 = d * d
+        m2 = np.nansum(d2, axis=0)
+        m3 = np.nansum(d2 * d, axis=0)
+        m4 = np.nansum(d2 * d2, axis=0)
+        m2[np.abs(m2) < 1e-14] = 0  # constant columns; pandas zeroes the same float error
+        with np.errstate(divide='ignore', invalid='ignore'):
+            skew = np.sqrt(n * (n - 1)) / (n - 2) * (m3 / n) / (m2 / n) ** 1.5
+            kurt = (n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2)
+                    - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
+        skew = np.where(n < 3, np.nan, np.where(m2 == 0, 0.0, skew))
+        kurt = np.where(n < 4, np.nan, np.where(m2 == 0, 0.0, kurt))
+        return pd.Series(skew, index=numeric.columns), pd.Series(kurt, index=numeric.columns)
+
+    def _corr(self) -> pd.DataFrame:
+        """Pearson correlation of all numeric columns, computed once per dataset.
+
+        Every correlation consumer reads this shared matrix (or a .loc slice of
+        it; pairwise correlations don't depend on the other columns), so treat
+        it as read-only. Without missing values the matrix is one BLAS product
+        of the standardized block; with them, _pairwise_corr reproduces
+        DataFrame.corr's pairwise-complete result with a few matrix products.
+        In compact mode the products run in float32, like the columns
+        themselves; the k x k result is widened back to float64.
+        """
+        key = self._data_fingerprint
+        if key is not None and key in self._corr_cache:
+            return self._corr_cache[key]
+
+        numeric = self.current_data[self._num_cols]
+        values = numeric.to_numpy(dtype=np.float32 if self.precision_mode == 'compact' else np.float64)
+        if len(values) > 1 and values.size and not np.isnan(values).any():
+            std = values.std(axis=0, ddof=1)
+            std[std == 0] = np.nan  # constant columns correlate as NaN, like pandas
+            z = (values - values.mean(axis=0)) / std
+            matrix = np.clip(z.T @ z / (len(values) - 1), -1.0, 1.0).astype(np.float64)
+            np.fill_diagonal(matrix, np.where(np.isnan(std), np.nan, 1.0))
+            corr = pd.DataFrame(matrix, index=numeric.columns, columns=numeric.columns)
+        elif values.size:
+            corr = pd.DataFrame(self._pairwise_corr(values).astype(np.float64),
+                                index=numeric.columns, columns=numeric.columns)
+        else:
+            corr = numeric.corr()
+        if key is not None:
+            self._corr_cache = {key: corr}
+        return corr
+
+    @staticmethod
+    def _pairwise_corr(values: np.ndarray) -> np.ndarray:
+        """Pearson correlation over pairwise-complete rows, as DataFrame.corr computes it.
+
+        With 0/1 presence masks every per-pair sum (n, sum x, sum x^2, sum xy
+        over the rows where both columns are present) is one matrix product,
+        so the k^2 pairs cost a handful of GEMMs instead of a loop each.
+        Columns are centred on their overall mean first to limit cancellation.
+        """
+        mask = ~np.isnan(values)
+        present = mask.astype(values.dtype)
+        centred = np.where(mask, values - np.nanmean(values, axis=0), values.dtype.type(0))
+        n = present.T @ present
+        sums = centred.T @ present  # [i, j]: sum of column i over rows where i and j are present
+        squares = (centred * centred).T @ present
+        products = centred.T @ centred
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = products - sums * sums.T / n
+            ss = squares - sums * sums / n  # [i, j]: sum of squares of column i over those rows
+            denom = ss * ss.T
+            matrix = np.where((n >= 2) & (denom > 0), cov / np.sqrt(denom), np.nan)
+        matrix = np.clip(matrix, -1.0, 1.0)
+        np.fill_diagonal(matrix, np.where(np.diag(ss) > 0, 1.0, np.nan))
+        return matrix
+
+    def _value_counts(self, column: str) -> pd.Series:
+        """value_counts() of a column, computed once per dataset.
+
+        The summary, dashboard, chart and column-info helpers all count the
+        same categorical columns; they share this result (treat it as read-only).
+        """
+        store = self._value_counts_store()
+        counts = store.get(column)
+        if counts is None:
+            counts = self.current_data[column].value_counts()
+            store[column] = counts
+        return counts
+
+    def _value_counts_store(self) -> Dict[str, pd.Series]:
+        """The column -> value_counts() dict for the current fingerprint"""
+        key = self._data_fingerprint
+        if key is None:
+            return {}  # nothing is cached without a fingerprint, as for the other caches
+        store = self._value_counts_cache.get(key)
+        if store is None:
+            store = {}
+            self._value_counts_cache = {key: store}
+        return store
+
+    def _prime_value_counts(self, columns) -> None:
+        """Fill the value-count cache for several columns with one groupby.
+
+        The columns are stacked into a single long (col, val) frame and counted
+        in one hash pass instead of one value_counts() sweep per column.
+        """
+        store = self._value_counts_store()
+        missing = [c for c in columns if c not in store]
+        if len(missing) < 2:
+            return  # a single column is just as fast through _value_counts
+        
+        long = self.current_data[missing].melt(var_name='col', value_name='val').dropna(subset=['val'])
+        counts = long.groupby(['col', 'val'], sort=False).size()
+        present = set(counts.index.get_level_values(0))
+        for col in missing:
+            if col in present:
+                col_counts = counts.loc[col].sort_values(ascending=False)
+            else:  # all-null column
+                col_counts = pd.Series(dtype='int64')
+            store[col] = col_counts.rename_axis(col)
+
+    def _iqr_outliers(self) -> Dict[str, Dict[str, Any]]:
+        """1.5x IQR outlier summary for every non-empty numeric column.
+
+        Quartiles come from the cached profile and the bounds are broadcast
+        across the whole numeric block in one comparison, instead of a
+        dropna/quantile/filter round per column. Cached per dataset.
+        """
+        key = self._data_fingerprint
+        if key is not None and key in self._outlier_cache:
+            return self._outlier_cache[key]
+
+        numeric = self.current_data[self._num_cols]
+        profile = self._profile().loc[numeric.columns]
+        iqr = profile['75%'] - profile['25%']
+        lower = profile['25%'] - 1.5 * iqr
+        upper = profile['75%'] + 1.5 * iqr
+        values = numeric.to_numpy(dtype=np.float64)
+        mask = (values < lower.to_numpy()) | (values > upper.to_numpy())  # NaN compares False
+        counts = mask.sum(axis=0)
+
+        summary = {}
+        for j, col in enumerate(numeric.columns):
+            non_null = profile.at[col, 'count']
+            if non_null == 0:
+                continue
+            summary[col] = {
+                "outlier_count": int(counts[j]),
+                "outlier_percentage": float(counts[j] / non_null * 100),
+                "lower_bound": float(lower[col]),
+                "upper_bound": float(upper[col]),
+                "outlier_values": numeric[col].iloc[np.flatnonzero(mask[:, j])[:10]].tolist()  # Limit to first 10
+            }
+
+        if key is not None:
+            self._outlier_cache = {key: summary}
+        return summary
+
+    @staticmethod
+    def _correlated_pairs(corr_matrix: pd.DataFrame, threshold: float, top: Optional[int] = None,
+                          inclusive: bool = False) -> List[Tuple[str, str, float]]:
+        """Upper-triangle (col_i, col_j, r) pairs with |r| > threshold (>= if inclusive).
+
+        Scans the matrix once in NumPy instead of indexing it with .iloc per
+        pair; pairs come back in the same row-major order as the nested loops.
+        With top, only the top strongest pairs are returned, strongest first
+        (ties in row-major order), picked by a partition rather than by
+        sorting every pair.
+        """
+        values = corr_matrix.to_numpy()
+        ii, jj = np.triu_indices(values.shape[0], k=1)
+        flat = values[ii, jj]
+        cols = corr_matrix.columns
+        strength = np.abs(flat)
+        keep = np.flatnonzero(strength >= threshold if inclusive else strength > threshold)
+        if top is not None and len(keep) > top:
+            # The top-th strongest |r| is found by partition; pairs tied with it
+            # are then taken in row-major order, so the cut is deterministic
+            neg = -strength[keep]
+            cut = np.partition(neg, top - 1)[top - 1]
+            stronger = keep[neg < cut]
+            keep = np.sort(np.concatenate([stronger, keep[neg == cut][:top - len(stronger)]]))
+        if top is not None:
+            keep = keep[np.argsort(-strength[keep], kind='stable')]
+        return [(cols[ii[k]], cols[jj[k]], flat[k]) for k in keep]
+
     def suggest_analyses(self, message: Optional[str] = None) -> List[str]:
         """Public wrapper around internal suggestions with light intent boost.
 
@@ -117,10 +649,13 @@ class DataService(SerializationMixin):
             'statistics': {}
         }
         
-        for column in self.current_data.columns:
+        profile = self._profile()
+        total_count = len(self.current_data)
+        for column, dtype in self.current_data.dtypes.items():
+            row = profile.loc[column]
+            
             # Completeness
-            missing_count = self.current_data[column].isnull().sum()
-            total_count = len(self.current_data)
+            missing_count = row['missing']
             completeness = 1 - (missing_count / total_count)
             quality_metrics['completeness'][column] = {
                 'score': round(completeness * 100, 2),
@@ -128,7 +663,7 @@ class DataService(SerializationMixin):
             }
             
             # Uniqueness
-            unique_count = self.current_data[column].nunique()
+            unique_count = row['nunique']
             uniqueness = unique_count / total_count
             quality_metrics['uniqueness'][column] = {
                 'score': round(uniqueness * 100, 2),
@@ -136,16 +671,15 @@ class DataService(SerializationMixin):
             }
             
             # Data types
-            dtype = str(self.current_data[column].dtype)
-            quality_metrics['data_types'][column] = dtype
+            quality_metrics['data_types'][column] = row['dtype']
             
             # Basic statistics for numeric columns
-            if np.issubdtype(self.current_data[column].dtype, np.number):
+            if np.issubdtype(dtype, np.number):
                 stats = {
-                    'min': float(self.current_data[column].min()),
-                    'max': float(self.current_data[column].max()),
-                    'mean': float(self.current_data[column].mean()),
-                    'std': float(self.current_data[column].std())
+                    'min': float(row['min']),
+                    'max': float(row['max']),
+                    'mean': float(row['mean']),
+                    'std': float(row['std'])
                 }
                 quality_metrics['statistics'][column] = stats
         
@@ -168,30 +702,38 @@ class DataService(SerializationMixin):
             summary = {
                 'row_count': len(self.current_data),
                 'column_count': len(self.current_data.columns),
-                'memory_usage': int(self.current_data.memory_usage().sum()),
+                'memory_usage': int(self._profile()['memory_bytes'].sum()),
                 'numeric_columns': [],
                 'categorical_columns': [],
                 'datetime_columns': [],
                 'column_stats': {}
             }
             
-            for column in self.current_data.columns:
+            profile = self._profile()
+            # Value counts are only reported for low-cardinality columns; batch them
+            self._prime_value_counts([
+                column for column, dtype in self.current_data.dtypes.items()
+                if profile.at[column, 'nunique'] <= 10
+                and not np.issubdtype(dtype, np.number) and dtype != 'datetime64[ns]'
+            ])
+            for column, dtype in self.current_data.dtypes.items():
+                row = profile.loc[column]
                 col_summary = {
-                    'dtype': str(self.current_data[column].dtype),
-                    'unique_count': int(self.current_data[column].nunique()),
-                    'missing_count': int(self.current_data[column].isnull().sum())
+                    'dtype': row['dtype'],
+                    'unique_count': int(row['nunique']),
+                    'missing_count': int(row['missing'])
                 }
                 
-                if np.issubdtype(self.current_data[column].dtype, np.number):
+                if np.issubdtype(dtype, np.number):
                     summary['numeric_columns'].append(column)
                     col_summary.update({
-                        'min': float(self.current_data[column].min()),
-                        'max': float(self.current_data[column].max()),
-                        'mean': float(self.current_data[column].mean()),
-                        'median': float(self.current_data[column].median()),
-                        'std': float(self.current_data[column].std())
+                        'min': float(row['min']),
+                        'max': float(row['max']),
+                        'mean': float(row['mean']),
+                        'median': float(row['50%']),
+                        'std': float(row['std'])
                     })
-                elif self.current_data[column].dtype == 'datetime64[ns]':
+                elif dtype == 'datetime64[ns]':
                     summary['datetime_columns'].append(column)
                     col_summary.update({
                         'min': str(self.current_data[column].min()),
@@ -200,7 +742,7 @@ class DataService(SerializationMixin):
                 else:
                     summary['categorical_columns'].append(column)
                     if col_summary['unique_count'] <= 10:  # Only for columns with few unique values
-                        value_counts = self.current_data[column].value_counts()
+                        value_counts = self._value_counts(column)
                         col_summary['value_counts'] = {
                             str(k): int(v) for k, v in value_counts.items()
                         }
@@ -225,25 +767,51 @@ class DataService(SerializationMixin):
     def load_data(self, file_path: str, file_type: str = 'csv') -> Dict[str, Any]:
         """Load dataset from file with enhanced context awareness"""
         try:
-            if file_type.lower() == 'csv':
-                self.current_data = pd.read_csv(file_path)
-            elif file_type.lower() in ['xlsx', 'xls']:
-                self.current_data = pd.read_excel(file_path)
-            else:
+            file_type = file_type.lower()
+            if file_type not in ('csv', 'xlsx', 'xls'):
                 return {"error": "Unsupported file type"}
             
-            # Clear previous context
+            # Clear previous context before touching current_data, so a load
+            # that fails part-way never pairs the new frame with the previous
+            # dataset's caches (no fingerprint means nothing is served from them)
+            self._data_fingerprint = None
             self.data_context = {}
-            self.analysis_history = []
+            self.analysis_history = deque(maxlen=self.HISTORY_LIMIT)
             self.column_meanings = {}
             self.insights_cache = {}
+            self._context_cache = {}
+            self._profile_cache = {}
+            self._corr_cache = {}
+            self._value_counts_cache = {}
+            self._outlier_cache = {}
+            self._row_stats_cache = {}
+            self._correlation_analysis_cache = {}
+            self._summary_analysis_cache = {}
+            self._dashboard_cache = {}
+            
+            if file_type == 'csv':
+                # Infer each column's dtype from the whole file in one pass
+                # (low_memory=False) instead of per chunk, which re-parses and
+                # leaves mixed int/str columns as object; memory_map skips the
+                # buffered read copy.
+                self.current_data = pd.read_csv(file_path, low_memory=False, memory_map=True)
+            else:
+                self.current_data = pd.read_excel(file_path)
+            
+            if self.precision_mode == 'compact':
+                self._downcast_numeric()
+            self._index_column_types()
+            
+            self._data_fingerprint = self._compute_fingerprint()
             
             # Generate comprehensive data info
             self.data_info = self._generate_data_info()
             self.data_context = self._build_data_context()
             
-            # Prepare data for visualization
-            data_dict = self.current_data.to_dict('records')
+            # Prepare data for visualization. Only the first page is serialized
+            # here: to_dict('records') builds one dict per row, which dominates
+            # upload latency and memory on large files.
+            data_dict = self.current_data.head(self.PREVIEW_ROWS).to_dict('records')
             columns = list(self.current_data.columns)
             
             # Detect column types and ensure proper type inference
@@ -254,10 +822,16 @@ class DataService(SerializationMixin):
             numeric_columns = [col for col in columns if is_numeric(col)]
             categorical_columns = [col for col in columns if col not in numeric_columns]
             
-            # Ensure numeric columns are properly typed for visualization
-            for col in numeric_columns:
-                if not np.issubdtype(self.current_data[col].dtype, np.number):
-                    self.current_data[col] = pd.to_numeric(self.current_data[col], errors='coerce')
+            # Ensure numeric columns are properly typed for visualization.
+            # Assign all coerced columns at once: setting them one by one adds a
+            # separate block per column, fragmenting the frame that every later
+            # column-wise reduction (describe, corr, sum) walks. pandas already
+            # stores each column contiguously, so no transpose is needed.
+            to_coerce = [col for col in numeric_columns
+                         if not np.issubdtype(self.current_data[col].dtype, np.number)]
+            if to_coerce:
+                self.current_data[to_coerce] = self.current_data[to_coerce].apply(pd.to_numeric, errors='coerce')
+                self._index_column_types()
             
             # Create a map of column types for visualization
             column_types = {}
@@ -275,6 +849,7 @@ class DataService(SerializationMixin):
                 "categorical_columns": categorical_columns,
                 "column_types": column_types,
                 "total_rows": len(self.current_data),
+                "preview_rows": len(data_dict),
                 "shape": self.current_data.shape,
                 "data_types": {col: str(dtype) for col, dtype in self.current_data.dtypes.to_dict().items()},
                 "info": self.data_info,
@@ -286,13 +861,27 @@ class DataService(SerializationMixin):
         except Exception as e:
             return {"error": f"Failed to load data: {str(e)}"}
     
+    def get_page(self, offset: int = 0, limit: int = PREVIEW_ROWS) -> Dict[str, Any]:
+        """Return rows [offset, offset + limit) of the current dataset as records"""
+        if self.current_data is None:
+            return {"error": "No dataset loaded"}
+        
+        offset = max(offset, 0)
+        rows = self.current_data.iloc[offset:offset + max(limit, 0)].to_dict('records')
+        return self._json_safe({
+            "rows": rows,
+            "offset": offset,
+            "limit": limit,
+            "total_rows": len(self.current_data)
+        })
+    
     def _generate_data_info(self) -> Dict[str, Any]:
         """Generate comprehensive dataset information"""
         if self.current_data is None:
             return {}
             
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns.tolist()
-        categorical_cols = self.current_data.select_dtypes(include=['object']).columns.tolist()
+        numeric_cols = list(self._num_cols)
+        categorical_cols = list(self._cat_cols)
         date_cols = self._detect_date_columns()
         
         # Enhanced statistics with uniformity check
@@ -302,7 +891,7 @@ class DataService(SerializationMixin):
             "numeric_columns": numeric_cols,
             "categorical_columns": categorical_cols,
             "date_columns": date_cols,
-            "missing_values": self.current_data.isnull().sum().to_dict(),
+            "missing_values": self._profile()['missing'].to_dict(),
             "data_quality": self._assess_data_quality(),
             "column_stats": self._generate_column_statistics(),
             "sample_data": self.current_data.head(3).to_dict('records'),
@@ -324,33 +913,25 @@ class DataService(SerializationMixin):
             "low_variance_columns": []
         }
         
-        # Check each column for uniformity issues
-        for col in self.current_data.columns:
-            unique_values = self.current_data[col].nunique()
-            total_values = len(self.current_data[col].dropna())
-            
-            # Constant columns (single unique value)
-            if unique_values == 1:
-                issues["constant_columns"].append(col)
-            
+        # Every check reads frame-level results: nunique/missing/std from the
+        # cached profile and top-value counts from the cached value counts
+        profile = self._profile()
+        nunique = profile['nunique']
+        non_null = len(self.current_data) - profile['missing']
+        issues["constant_columns"] = nunique.index[nunique == 1].tolist()
+        for col in nunique.index[nunique > 1]:
             # Near-constant columns (>95% same value)
-            elif unique_values > 1:
-                value_counts = self.current_data[col].value_counts()
-                if value_counts.iloc[0] / total_values > 0.95:
-                    issues["near_constant_columns"].append(col)
-            
-            # Low variance numeric columns
-            if self.current_data[col].dtype in ['int64', 'float64']:
-                if self.current_data[col].var() < 0.01:  # Adjust threshold as needed
-                    issues["low_variance_columns"].append(col)
+            if self._value_counts(col).iloc[0] / non_null[col] > 0.95:
+                issues["near_constant_columns"].append(col)
+        
+        # Low variance numeric columns; other columns have a NaN std, which compares False
+        if 'std' in profile:
+            variance = profile['std'] ** 2
+            issues["low_variance_columns"] = variance.index[variance < 0.01].tolist()  # Adjust threshold as needed
         
         # Check for duplicate columns
-        correlation_matrix = self.current_data.corr()
-        for i in range(len(correlation_matrix.columns)):
-            for j in range(i + 1, len(correlation_matrix.columns)):
-                if abs(correlation_matrix.iloc[i, j]) > 0.999:  # Nearly identical columns
-                    col1, col2 = correlation_matrix.columns[i], correlation_matrix.columns[j]
-                    issues["duplicate_columns"].append(f"{col1} ≈ {col2}")
+        for col1, col2, _ in self._correlated_pairs(self._corr(), 0.999):  # Nearly identical columns
+            issues["duplicate_columns"].append(f"{col1} ≈ {col2}")
         
         return issues
 
@@ -367,10 +948,19 @@ class DataService(SerializationMixin):
         return context
     
     def get_analytics_dashboard(self) -> Dict[str, Any]:
-        """Generate comprehensive analytics dashboard"""
+        """Generate comprehensive analytics dashboard.
+
+        Every section only depends on the loaded data, so the result is cached
+        per dataset and repeated polls (/analytics-dashboard, /statistics) are
+        served without re-running the sub-analyses.
+        """
         if self.current_data is None:
             return {"error": "No dataset loaded"}
         
+        key = self._data_fingerprint
+        if key is not None and key in self._dashboard_cache:
+            return self._dashboard_cache[key]
+        
         dashboard = {
             "summary_statistics": self._get_comprehensive_statistics(),
             "data_quality_report": self._get_data_quality_report(),
@@ -383,44 +973,50 @@ class DataService(SerializationMixin):
             "ai_insights": self._generate_comprehensive_ai_insights(),
             "recommendations": self._get_analysis_recommendations()
         }
-        return self._json_safe(dashboard)
+        dashboard = self._json_safe(dashboard)
+        if key is not None:
+            self._dashboard_cache = {key: dashboard}
+        return dashboard
     
     def _get_comprehensive_statistics(self) -> Dict[str, Any]:
         """Get comprehensive statistical analysis"""
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._num_cols
+        profile = self._profile()
         stats_data = {}
         
         for col in numeric_cols:
-            col_data = self.current_data[col].dropna()
-            if len(col_data) > 0:
+            row = profile.loc[col]
+            if row['count'] > 0:
+                mode = self.current_data[col].mode()
                 stats_data[col] = {
-                    "count": int(len(col_data)),
-                    "mean": float(col_data.mean()),
-                    "median": float(col_data.median()),
-                    "mode": float(col_data.mode().iloc[0]) if len(col_data.mode()) > 0 else None,
-                    "std": float(col_data.std()),
-                    "variance": float(col_data.var()),
-                    "min": float(col_data.min()),
-                    "max": float(col_data.max()),
-                    "q25": float(col_data.quantile(0.25)),
-                    "q75": float(col_data.quantile(0.75)),
-                    "iqr": float(col_data.quantile(0.75) - col_data.quantile(0.25)),
-                    "skewness": float(col_data.skew()),
-                    "kurtosis": float(col_data.kurtosis()),
-                    "range": float(col_data.max() - col_data.min()),
-                    "coefficient_of_variation": float(col_data.std() / col_data.mean() * 100) if col_data.mean() != 0 else 0
+                    "count": int(row['count']),
+                    "mean": float(row['mean']),
+                    "median": float(row['50%']),
+                    "mode": float(mode.iloc[0]) if len(mode) > 0 else None,
+                    "std": float(row['std']),
+                    "variance": float(row['std'] ** 2),
+                    "min": float(row['min']),
+                    "max": float(row['max']),
+                    "q25": float(row['25%']),
+                    "q75": float(row['75%']),
+                    "iqr": float(row['75%'] - row['25%']),
+                    "skewness": float(row['skew']),
+                    "kurtosis": float(row['kurt']),
+                    "range": float(row['max'] - row['min']),
+                    "coefficient_of_variation": float(row['std'] / row['mean'] * 100) if row['mean'] != 0 else 0
                 }
         
+        complete_rows = self._row_stats()['complete_rows']
         return {
             "numeric_statistics": stats_data,
             "overall_summary": {
                 "total_rows": len(self.current_data),
                 "total_columns": len(self.current_data.columns),
                 "numeric_columns": len(numeric_cols),
-                "categorical_columns": len(self.current_data.select_dtypes(include=['object']).columns),
-                "missing_cells": int(self.current_data.isnull().sum().sum()),
-                "complete_rows": int(len(self.current_data.dropna())),
-                "data_completeness_percentage": float(len(self.current_data.dropna()) / len(self.current_data) * 100)
+                "categorical_columns": len(self._cat_cols),
+                "missing_cells": int(profile['missing'].sum()),
+                "complete_rows": complete_rows,
+                "data_completeness_percentage": float(complete_rows / len(self.current_data) * 100)
             }
         }
     
@@ -428,29 +1024,40 @@ class DataService(SerializationMixin):
         """Generate comprehensive data quality report"""
         quality_issues = []
         column_quality = {}
+        profile = self._profile()
+        total = len(self.current_data)
         
-        for col in self.current_data.columns:
-            col_data = self.current_data[col]
+        for col, dtype in self.current_data.dtypes.items():
+            missing = int(profile.at[col, 'missing'])
+            unique = int(profile.at[col, 'nunique'])
             col_quality = {
-                "completeness": float((len(col_data) - col_data.isnull().sum()) / len(col_data) * 100),
-                "uniqueness": float(col_data.nunique() / len(col_data) * 100),
+                "completeness": float((total - missing) / total * 100),
+                "uniqueness": float(unique / total * 100),
                 "issues": []
             }
             
             # Check for various quality issues
-            if col_data.isnull().sum() > len(col_data) * 0.1:  # More than 10% missing
+            if missing > total * 0.1:  # More than 10% missing
                 col_quality["issues"].append("high_missing_values")
-                quality_issues.append(f"Column '{col}' has {col_data.isnull().sum()} missing values ({col_data.isnull().sum()/len(col_data)*100:.1f}%)")
+                quality_issues.append(f"Column '{col}' has {missing} missing values ({missing/total*100:.1f}%)")
             
-            if col_data.nunique() == 1:
+            if unique == 1:
                 col_quality["issues"].append("constant_values")
                 quality_issues.append(f"Column '{col}' has constant values")
             
-            if col_data.dtype == 'object':
-                # Check for inconsistent formatting
-                string_lengths = col_data.dropna().astype(str).str.len()
-                if string_lengths.var() > string_lengths.mean() * 2:
-                    col_quality["issues"].append("inconsistent_formatting")
+            if dtype == 'object':
+                # Check for inconsistent formatting. Length mean/variance are
+                # weighted over the cached distinct values, so only each
+                # distinct string is measured rather than every row.
+                counts = self._value_counts(col)
+                weights = counts.to_numpy(dtype=float)
+                n = weights.sum()
+                if n > 1:
+                    lengths = counts.index.astype(str).str.len().to_numpy(dtype=float)
+                    mean_len = weights @ lengths / n
+                    var_len = weights @ (lengths - mean_len) ** 2 / (n - 1)
+                    if var_len > mean_len * 2:
+                        col_quality["issues"].append("inconsistent_formatting")
             
             column_quality[col] = col_quality
         
@@ -463,26 +1070,23 @@ class DataService(SerializationMixin):
     
     def _get_correlation_insights(self) -> Dict[str, Any]:
         """Get correlation analysis with insights"""
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._num_cols
         
         if len(numeric_cols) < 2:
             return {"message": "Need at least 2 numeric columns for correlation analysis"}
         
-        corr_matrix = self.current_data[numeric_cols].corr()
+        corr_matrix = self._corr()
         
         # Find strong correlations
         strong_correlations = []
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i + 1, len(corr_matrix.columns)):
-                corr_val = corr_matrix.iloc[i, j]
-                if abs(corr_val) > 0.7:  # Strong correlation threshold
-                    strong_correlations.append({
-                        "variable_1": corr_matrix.columns[i],
-                        "variable_2": corr_matrix.columns[j],
-                        "correlation": float(corr_val),
-                        "strength": "strong positive" if corr_val > 0.7 else "strong negative",
-                        "interpretation": self._interpret_correlation(corr_matrix.columns[i], corr_matrix.columns[j], corr_val)
-                    })
+        for var1, var2, corr_val in self._correlated_pairs(corr_matrix, 0.7):  # Strong correlation threshold
+            strong_correlations.append({
+                "variable_1": var1,
+                "variable_2": var2,
+                "correlation": float(corr_val),
+                "strength": "strong positive" if corr_val > 0.7 else "strong negative",
+                "interpretation": self._interpret_correlation(var1, var2, corr_val)
+            })
         
         return {
             "correlation_matrix": corr_matrix.to_dict(),
@@ -496,19 +1100,21 @@ class DataService(SerializationMixin):
     
     def _get_distribution_analysis(self) -> Dict[str, Any]:
         """Analyze distributions of numeric columns"""
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._num_cols
+        profile = self._profile()
+        outliers = self._iqr_outliers()
         distributions = {}
         
         for col in numeric_cols:
-            col_data = self.current_data[col].dropna()
-            if len(col_data) > 0:
+            row = profile.loc[col]
+            if row['count'] > 0:
                 # Basic distribution info
                 dist_info = {
-                    "distribution_type": self._identify_distribution_type(col_data),
-                    "normality_test": self._test_normality(col_data),
-                    "outliers": self._detect_outliers_column(col_data),
+                    "distribution_type": self._identify_distribution_type(row['skew'], row['kurt']),
+                    "normality_test": self._test_normality(row['count'], row['skew'], row['kurt']),
+                    "outliers": outliers[col],
                     "percentiles": {
-                        f"p{p}": float(col_data.quantile(p/100)) 
+                        f"p{p}": float(row[f"{p}%"])
                         for p in [1, 5, 10, 25, 50, 75, 90, 95, 99]
                     }
                 }
@@ -518,19 +1124,20 @@ class DataService(SerializationMixin):
     
     def _get_categorical_analysis(self) -> Dict[str, Any]:
         """Analyze categorical columns"""
-        categorical_cols = self.current_data.select_dtypes(include=['object']).columns
+        categorical_cols = self._cat_cols
         categorical_analysis = {}
+        self._prime_value_counts(categorical_cols)
         
         for col in categorical_cols:
-            col_data = self.current_data[col].dropna()
-            value_counts = col_data.value_counts()
+            value_counts = self._value_counts(col)
+            non_null = value_counts.sum()
             
             categorical_analysis[col] = {
-                "unique_count": int(col_data.nunique()),
+                "unique_count": int(len(value_counts)),
                 "most_common": value_counts.head(5).to_dict(),
                 "least_common": value_counts.tail(5).to_dict(),
                 "diversity_index": float(self._calculate_diversity_index(value_counts)),
-                "concentration": float(value_counts.iloc[0] / len(col_data) * 100) if len(value_counts) > 0 else 0,
+                "concentration": float(value_counts.iloc[0] / non_null * 100) if len(value_counts) > 0 else 0,
                 "category_distribution": "uniform" if value_counts.std() < value_counts.mean() * 0.5 else "skewed"
             }
         
@@ -542,7 +1149,7 @@ class DataService(SerializationMixin):
         
         try:
             # Distribution charts for numeric columns
-            numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns[:4]  # Limit to first 4
+            numeric_cols = self._num_cols[:4]  # Limit to first 4
             for col in numeric_cols:
                 chart_data = self._create_distribution_chart(col)
                 if chart_data:
@@ -556,7 +1163,7 @@ class DataService(SerializationMixin):
             charts["missing_values"] = self._create_missing_values_chart()
             
             # Top categories charts for categorical columns
-            categorical_cols = self.current_data.select_dtypes(include=['object']).columns[:2]
+            categorical_cols = self._cat_cols[:2]
             for col in categorical_cols:
                 chart_data = self._create_category_chart(col)
                 if chart_data:
@@ -584,12 +1191,11 @@ class DataService(SerializationMixin):
             profile = {
                 'primary_entity': self._infer_primary_entity(),
                 'key_dimensions': self._identify_dimensions(),
-                'metrics': key_metrics,
+                'metrics': [metric['name'] for metric in key_metrics],
                 'temporal_range': temporal_aspects.get('range'),
                 'data_quality': {
-                    'completeness': data_quality.get('completeness', 0),
-                    'consistency': data_quality.get('consistency', 0),
-                    'issues': data_quality.get('issues', [])
+                    'completeness': data_quality['completeness_score'],
+                    'issues': self._data_quality_issues(data_quality)
                 },
                 'relationships': relationships,
                 'patterns': column_patterns
@@ -629,15 +1235,16 @@ class DataService(SerializationMixin):
         """Analyze patterns and characteristics of each column"""
         patterns = {}
         
+        profile = self._profile()
         for column in self.current_data.columns:
             col_data = self.current_data[column]
             patterns[column] = {
-                'type': str(col_data.dtype),
-                'unique_count': col_data.nunique(),
-                'missing_pct': (col_data.isna().sum() / len(col_data)) * 100,
-                'sample_values': col_data.dropna().unique()[:5].tolist(),
-                'distribution_type': self._detect_distribution_type(col_data),
-                'potential_role': self._infer_column_role(column, col_data)
+                'type': profile.at[column, 'dtype'],
+                'unique_count': profile.at[column, 'nunique'],
+                'missing_pct': (profile.at[column, 'missing'] / len(col_data)) * 100,
+                'sample_values': self._first_non_null(col_data, 5, distinct=True),
+                'distribution_type': self._detect_distribution_type(column),
+                'potential_role': self._infer_column_role(column)
             }
             
         return patterns
@@ -645,38 +1252,74 @@ class DataService(SerializationMixin):
     def _detect_column_relationships(self) -> list:
         """Detect potential relationships between columns"""
         relationships = []
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._num_cols
         
         # Correlation analysis for numeric columns
         if len(numeric_cols) > 1:
-            corr_matrix = self.current_data[numeric_cols].corr()
             strong_correlations = []
-            for i in range(len(numeric_cols)):
-                for j in range(i+1, len(numeric_cols)):
-                    corr = corr_matrix.iloc[i, j]
-                    if abs(corr) > 0.7:  # Strong correlation threshold
-                        strong_correlations.append({
-                            'columns': [numeric_cols[i], numeric_cols[j]],
-                            'correlation': corr,
-                            'type': 'strong_correlation'
-                        })
+            for col1, col2, corr in self._correlated_pairs(self._corr(), 0.7):  # Strong correlation threshold
+                strong_correlations.append({
+                    'columns': [col1, col2],
+                    'correlation': corr,
+                    'type': 'strong_correlation'
+                })
             relationships.extend(strong_correlations)
         
         # Categorical relationship analysis
-        cat_cols = self.current_data.select_dtypes(include=['object']).columns
-        for col1 in cat_cols:
-            for col2 in cat_cols:
-                if col1 < col2:  # Avoid duplicate combinations
-                    relation = self._analyze_categorical_relationship(col1, col2)
-                    if relation:
-                        relationships.append(relation)
+        relationships.extend(self._categorical_associations(0.5))
         
         return relationships
     
+    def _categorical_associations(self, threshold: float, max_columns: int = 8, max_levels: int = 50) -> list:
+        """Categorical column pairs whose Cramer's V is at least `threshold`.
+
+        Each column is factorized to int codes once; a pair's contingency table
+        is then a single bincount over the combined codes. Columns with more
+        than min(max_levels, sqrt(rows)) distinct values are skipped: near-unique
+        columns (ids, names, free text) give a trivially high V, and the dense
+        table would grow with the product of the two cardinalities. Of the
+        rest, the `max_columns` lowest-cardinality non-constant ones are paired.
+        """
+        nunique = self._profile()['nunique']
+        level_cap = min(max_levels, np.sqrt(len(self.current_data)))
+        candidates = sorted((c for c in self._cat_cols if 1 < nunique[c] <= level_cap),
+                            key=lambda c: nunique[c])[:max_columns]
+        codes = {}
+        for col in candidates:
+            col_codes, uniques = pd.factorize(self.current_data[col])
+            codes[col] = (col_codes, len(uniques))
+        
+        associations = []
+        for i, col1 in enumerate(candidates):
+            codes1, k1 = codes[col1]
+            for col2 in candidates[i + 1:]:
+                codes2, k2 = codes[col2]
+                valid = (codes1 >= 0) & (codes2 >= 0)  # factorize marks NaN as -1
+                table = np.bincount(codes1[valid] * k2 + codes2[valid], minlength=k1 * k2).reshape(k1, k2)
+                n = table.sum()
+                if n == 0:
+                    continue
+                rows = table.sum(axis=1, keepdims=True)
+                cols = table.sum(axis=0, keepdims=True)
+                keep = rows[:, 0] > 0, cols[0] > 0  # drop levels that only occur against NaN
+                table, rows, cols = table[keep[0]][:, keep[1]], rows[keep[0]], cols[:, keep[1]]
+                dof = min(table.shape) - 1
+                if dof == 0:
+                    continue
+                phi2 = (table ** 2 / (rows * cols)).sum() - 1  # chi2 / n
+                cramers_v = float(np.sqrt(max(phi2, 0.0) / dof))
+                if cramers_v >= threshold:
+                    associations.append({
+                        'columns': [col1, col2],
+                        'cramers_v': cramers_v,
+                        'type': 'categorical_association'
+                    })
+        return associations
+    
     def _identify_key_metrics(self) -> list:
         """Identify potential key metrics in the dataset"""
         metrics = []
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._num_cols
         
         for col in numeric_cols:
             # Check for common metric patterns
@@ -697,10 +1340,7 @@ class DataService(SerializationMixin):
         temporal_info = {'has_temporal': False, 'columns': [], 'range': None}
         
         # Identify date/time columns
-        date_columns = []
-        for col in self.current_data.columns:
-            if self._is_temporal_column(col):
-                date_columns.append(col)
+        date_columns = self._detect_date_columns()
                 
         if date_columns:
             temporal_info['has_temporal'] = True
@@ -732,6 +1372,67 @@ class DataService(SerializationMixin):
             suggestions.append(f"Correlation analysis between {' and '.join(profile['metrics'][:2])}")
             
         return suggestions
+    
+    def _detect_distribution_type(self, column: str) -> str:
+        """Distribution shape of a numeric column from the profile's moments; 'categorical' otherwise"""
+        if column not in self._num_cols:
+            return "categorical"
+        profile = self._profile()
+        skewness, kurtosis = profile.at[column, 'skew'], profile.at[column, 'kurt']
+        if pd.isna(skewness) or pd.isna(kurtosis):
+            return "unknown"
+        return self._identify_distribution_type(skewness, kurtosis)
+    
+    def _infer_column_role(self, column: str) -> str:
+        """Guess whether a column is an identifier, a metric or a dimension"""
+        nunique = self._profile().at[column, 'nunique']
+        if nunique == len(self.current_data) and 'id' in column.lower():
+            return "identifier"
+        if column in self._num_cols:
+            return "metric"
+        return "dimension"
+    
+    def _suggest_aggregation(self, column: str) -> str:
+        """Aggregation that suits a metric column: totals for amounts and counts, means for the rest"""
+        if any(term in column.lower() for term in ['amount', 'price', 'cost', 'revenue', 'profit', 'count', 'quantity']):
+            return "sum"
+        return "mean"
+    
+    def _summarize_distribution(self, series: pd.Series) -> str:
+        """Distribution shape of a numeric column, as _detect_distribution_type"""
+        return self._detect_distribution_type(series.name)
+    
+    def _infer_primary_entity(self) -> str:
+        """What one row describes, from the dataset type inferred at load"""
+        dataset_type = self._infer_dataset_type()
+        if dataset_type in ("unknown", "general_data"):  # no column-name match
+            return "record"
+        return dataset_type.replace('_data', '').replace('_', ' ')
+    
+    def _identify_dimensions(self, max_unique: int = 50) -> List[str]:
+        """Categorical columns with few enough distinct values to group by"""
+        nunique = self._profile()['nunique']
+        return [col for col in self._cat_cols if 1 < nunique[col] <= max_unique]
+    
+    def _data_quality_issues(self, data_quality: Dict[str, Any]) -> List[str]:
+        """Human-readable issues from _assess_data_quality's report"""
+        issues = []
+        if data_quality['columns_with_missing_data']:
+            issues.append(f"{data_quality['columns_with_missing_data']} columns have missing values")
+        if data_quality['duplicate_rows']:
+            issues.append(f"{data_quality['duplicate_rows']} duplicate rows")
+        return issues
+    
+    def _get_entity_description(self, profile: dict) -> str:
+        """Opening phrase of the brief summary, e.g. '1,200 sales records across 8 columns.'"""
+        rows, cols = self.current_data.shape
+        entity = profile['primary_entity']
+        entity = f"{entity} records" if entity != "record" else "records"
+        return f"{rows:,} {entity} across {cols} columns."
+    
+    def _format_data_quality_message(self, data_quality: dict) -> str:
+        """Data quality sentence for the brief summary"""
+        return f"{data_quality['completeness']}% complete; " + "; ".join(data_quality['issues']) + "."
 
     def get_ai_dataset_context(self) -> str:
         """Get comprehensive dataset context for AI consumption"""
@@ -746,8 +1447,8 @@ class DataService(SerializationMixin):
         context_parts.append(f"- Columns: {', '.join(self.current_data.columns.tolist())}")
         
         # Data types and patterns
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns.tolist()
-        categorical_cols = self.current_data.select_dtypes(include=['object']).columns.tolist()
+        numeric_cols = self._num_cols
+        categorical_cols = self._cat_cols
         
         if numeric_cols:
             context_parts.append(f"- Numeric columns: {', '.join(numeric_cols)}")
@@ -762,13 +1463,14 @@ class DataService(SerializationMixin):
         # Key statistics
         if numeric_cols:
             context_parts.append(f"\nKey Statistics:")
+            profile = self._profile()
             for col in numeric_cols[:5]:  # Limit to first 5 numeric columns
-                col_data = self.current_data[col].dropna()
-                if len(col_data) > 0:
-                    context_parts.append(f"- {col}: mean={col_data.mean():.2f}, std={col_data.std():.2f}, range=[{col_data.min():.2f}, {col_data.max():.2f}]")
+                row = profile.loc[col]
+                if row['count'] > 0:
+                    context_parts.append(f"- {col}: mean={row['mean']:.2f}, std={row['std']:.2f}, range=[{row['min']:.2f}, {row['max']:.2f}]")
         
         # Missing values info
-        missing_info = self.current_data.isnull().sum()
+        missing_info = self._profile()['missing']
         if missing_info.sum() > 0:
             context_parts.append(f"\nMissing Values:")
             for col, missing_count in missing_info[missing_info > 0].items():
@@ -802,21 +1504,21 @@ class DataService(SerializationMixin):
             
             # Statistical queries
             if any(word in question_lower for word in ['average', 'mean', 'median', 'sum', 'total']):
-                numeric_cols = mentioned_cols if mentioned_cols else self.current_data.select_dtypes(include=[np.number]).columns.tolist()
+                numeric_cols = mentioned_cols if mentioned_cols else self._num_cols
                 result["data"]["statistics"] = {}
+                profile = self._profile()
                 for col in numeric_cols[:5]:  # Limit to 5 columns
-                    col_data = self.current_data[col].dropna()
-                    if len(col_data) > 0:
+                    if col in self._num_cols and profile.at[col, 'count'] > 0:
                         result["data"]["statistics"][col] = {
-                            "mean": float(col_data.mean()),
-                            "median": float(col_data.median()),
-                            "sum": float(col_data.sum()),
-                            "count": int(len(col_data))
+                            "mean": float(profile.at[col, 'mean']),
+                            "median": float(profile.at[col, '50%']),
+                            "sum": float(profile.at[col, 'sum']),
+                            "count": int(profile.at[col, 'count'])
                         }
             
             # Distribution queries
             if any(word in question_lower for word in ['distribution', 'spread', 'range', 'histogram']):
-                cols_to_analyze = mentioned_cols if mentioned_cols else self.current_data.select_dtypes(include=[np.number]).columns.tolist()[:3]
+                cols_to_analyze = mentioned_cols if mentioned_cols else self._num_cols[:3]
                 result["data"]["distributions"] = {}
                 for col in cols_to_analyze:
                     result["data"]["distributions"][col] = self._get_distribution_summary(col)
@@ -838,7 +1540,7 @@ class DataService(SerializationMixin):
             
             # Generate contextual answer
             result["answer"] = self._generate_contextual_answer(question, result["data"])
-            result["context"] = self.get_ai_dataset_context()
+            result["context"] = self.get_cached_context_bundle()['dataset_context']
             
         except Exception as e:
             result["error"] = f"Error processing query: {str(e)}"
@@ -848,29 +1550,22 @@ class DataService(SerializationMixin):
     def _detect_date_columns(self) -> List[str]:
         """Detect columns that might contain dates"""
         date_cols = []
-        for col in self.current_data.columns:
-            if self.current_data[col].dtype == 'object':
-                sample = self.current_data[col].dropna().head(10)
-                date_patterns = [
-                    r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-                    r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
-                    r'\d{2}-\d{2}-\d{4}',  # MM-DD-YYYY
-                ]
-                for value in sample:
-                    if any(re.match(pattern, str(value)) for pattern in date_patterns):
-                        date_cols.append(col)
-                        break
+        for col in self._cat_cols:
+            sample = self._first_non_null(self.current_data[col], 10)
+            if any(_DATE_PREFIX_RE.match(str(value)) for value in sample):
+                date_cols.append(col)
         return date_cols
     
     def _assess_data_quality(self) -> Dict[str, Any]:
         """Assess the quality of the dataset"""
         total_cells = len(self.current_data) * len(self.current_data.columns)
-        missing_cells = self.current_data.isnull().sum().sum()
+        missing = self._profile()['missing']
+        missing_cells = missing.sum()
         
         quality = {
             "completeness_score": round((1 - missing_cells / total_cells) * 100, 2),
-            "duplicate_rows": self.current_data.duplicated().sum(),
-            "columns_with_missing_data": len([col for col in self.current_data.columns if self.current_data[col].isnull().any()]),
+            "duplicate_rows": self._row_stats()['duplicate_rows'],
+            "columns_with_missing_data": int((missing > 0).sum()),
             "uniformity_issues": self._detect_uniformity_issues()
         }
         return quality
@@ -878,24 +1573,29 @@ class DataService(SerializationMixin):
     def _generate_column_statistics(self) -> Dict[str, Dict]:
         """Generate detailed statistics for each column"""
         stats = {}
-        for col in self.current_data.columns:
-            if self.current_data[col].dtype in ['int64', 'float64']:
+        profile = self._profile()
+        total = len(self.current_data)
+        self._prime_value_counts(self._cat_cols)  # one groupby for every most_common below
+        for col, dtype in self.current_data.dtypes.items():
+            row = profile.loc[col]
+            all_null = row['missing'] == total
+            if self._is_int_or_float(dtype):
                 stats[col] = {
                     "type": "numeric",
-                    "mean": float(self.current_data[col].mean()) if not self.current_data[col].isnull().all() else None,
-                    "median": float(self.current_data[col].median()) if not self.current_data[col].isnull().all() else None,
-                    "std": float(self.current_data[col].std()) if not self.current_data[col].isnull().all() else None,
-                    "min": float(self.current_data[col].min()) if not self.current_data[col].isnull().all() else None,
-                    "max": float(self.current_data[col].max()) if not self.current_data[col].isnull().all() else None,
-                    "unique_count": int(self.current_data[col].nunique()),
+                    "mean": None if all_null else float(row['mean']),
+                    "median": None if all_null else float(row['50%']),
+                    "std": None if all_null else float(row['std']),
+                    "min": None if all_null else float(row['min']),
+                    "max": None if all_null else float(row['max']),
+                    "unique_count": int(row['nunique']),
                     "outliers": self._detect_outliers(col)
                 }
             else:
                 stats[col] = {
                     "type": "categorical",
-                    "unique_count": int(self.current_data[col].nunique()),
-                    "most_common": self.current_data[col].value_counts().head(3).to_dict() if not self.current_data[col].isnull().all() else {},
-                    "missing_count": int(self.current_data[col].isnull().sum())
+                    "unique_count": int(row['nunique']),
+                    "most_common": {} if all_null else self._value_counts(col).head(3).to_dict(),
+                    "missing_count": int(row['missing'])
                 }
         return stats
     
@@ -907,18 +1607,20 @@ class DataService(SerializationMixin):
         if self._detect_date_columns():
             patterns.append("time_series_data")
         
+        # One string of all lowercased names, one per line, so each keyword
+        # check below is a single regex scan instead of columns x keywords
+        names = '\n'.join(col_lower for _, col_lower, _ in self._column_terms)
+        
         # Check for hierarchical data
-        if any('_id' in col.lower() or 'id' == col.lower() for col in self.current_data.columns):
+        if _IDENTIFIER_RE.search(names):
             patterns.append("has_identifiers")
         
         # Check for geographic data
-        geo_keywords = ['country', 'state', 'city', 'region', 'latitude', 'longitude', 'lat', 'lng', 'zip']
-        if any(keyword in col.lower() for col in self.current_data.columns for keyword in geo_keywords):
+        if _GEO_KEYWORDS_RE.search(names):
             patterns.append("geographic_data")
         
         # Check for financial data
-        finance_keywords = ['price', 'cost', 'revenue', 'profit', 'sales', 'amount', 'value']
-        if any(keyword in col.lower() for col in self.current_data.columns for keyword in finance_keywords):
+        if _FINANCE_KEYWORDS_RE.search(names):
             patterns.append("financial_data")
         
         return patterns
@@ -944,24 +1646,9 @@ class DataService(SerializationMixin):
         
         if not result:
             # Fallback to rule-based analysis
-            if any(word in query_lower for word in ['average', 'mean', 'avg']):
-                result = self._calculate_averages(query)
-            elif any(word in query_lower for word in ['correlation', 'correlate', 'relationship']):
-                result = self._analyze_correlation(query)
-            elif any(word in query_lower for word in ['trend', 'trends', 'time', 'over time']):
-                result = self._analyze_trends(query)
-            elif any(word in query_lower for word in ['distribution', 'histogram', 'spread']):
-                result = self._analyze_distribution(query)
-            elif any(word in query_lower for word in ['summary', 'describe', 'overview']):
-                result = self._generate_summary()
-            elif any(word in query_lower for word in ['compare', 'comparison', 'vs', 'versus']):
-                result = self._compare_data(query)
-            elif any(word in query_lower for word in ['top', 'highest', 'largest', 'maximum']):
-                result = self._find_top_values(query)
-            elif any(word in query_lower for word in ['bottom', 'lowest', 'smallest', 'minimum']):
-                result = self._find_bottom_values(query)
-            else:
-                result = self._general_analysis(query)
+            handler = next((name for pattern, name in _QUERY_INTENTS if pattern.search(query_lower)),
+                           '_general_analysis')
+            result = getattr(self, handler)(query)
         
         # Add context and AI insights to result
         if result and 'error' not in result:
@@ -969,10 +1656,11 @@ class DataService(SerializationMixin):
             result['ai_insights'] = self._generate_ai_insights(result)
             result['related_analyses'] = self._suggest_related_analyses(query, result)
             
-            # Store successful analysis
+            # Store successful analysis; only its type, since the full result
+            # (matrices, summaries) is already returned to the caller
             self.analysis_history.append({
                 "query": query,
-                "result": result,
+                "analysis_type": result.get('analysis_type'),
                 "timestamp": datetime.now().isoformat(),
                 "type": "completed_analysis"
             })
@@ -1000,21 +1688,12 @@ class DataService(SerializationMixin):
     
     def _extract_columns_from_query(self, query: str) -> List[str]:
         """Extract column names mentioned in the query"""
-        mentioned_cols = []
-        query_words = query.lower().split()
-        
-        for col in self.current_data.columns:
-            col_lower = col.lower()
-            col_words = col_lower.replace('_', ' ').split()
-            
-            # Direct match
-            if col_lower in query.lower():
-                mentioned_cols.append(col)
-            # Partial word matches
-            elif any(word in query_words for word in col_words):
-                mentioned_cols.append(col)
-        
-        return mentioned_cols
+        query_lower = query.lower()
+        query_words = set(query_lower.split())
+        # Direct match on the whole name, else any shared word; the lowercased
+        # names and word sets are built once per load by _index_column_types
+        return [col for col, col_lower, col_words in self._column_terms
+                if col_lower in query_lower or not col_words.isdisjoint(query_words)]
     
     def _determine_analysis_type(self, query: str, mentioned_columns: List[str]) -> str:
         """Determine the most appropriate analysis type"""
@@ -1042,13 +1721,13 @@ class DataService(SerializationMixin):
     
     def _calculate_averages(self, query: str) -> Dict[str, Any]:
         """Calculate averages based on query"""
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._num_cols
         
         if len(numeric_cols) == 0:
             return {"error": "No numeric columns found"}
         
-        # Simple average calculation
-        averages = self.current_data[numeric_cols].mean().to_dict()
+        # Column means from the cached profile (NaN for all-null columns, like .mean())
+        averages = self._profile().loc[numeric_cols, 'mean'].astype(np.float64).to_dict()
         
         # Generate visualization
         chart_path = self._create_bar_chart(
@@ -1067,40 +1746,47 @@ class DataService(SerializationMixin):
         }
     
     def _analyze_correlation(self, query: str) -> Dict[str, Any]:
-        """Analyze correlations between variables"""
-        numeric_data = self.current_data.select_dtypes(include=[np.number])
-        
-        if len(numeric_data.columns) < 2:
+        """Analyze correlations between variables.
+
+        The result (heatmap PNG included) only depends on the loaded data, so
+        repeated correlation queries and /insights calls reuse it per dataset.
+        Callers get a shallow copy since process_query adds per-query keys.
+        """
+        if len(self._num_cols) < 2:
             return {"error": "Need at least 2 numeric columns for correlation analysis"}
         
-        correlation_matrix = numeric_data.corr()
+        key = self._data_fingerprint
+        if key is not None and key in self._correlation_analysis_cache:
+            return dict(self._correlation_analysis_cache[key])
+        
+        correlation_matrix = self._corr()
         
         # Generate heatmap
-        chart_path = self._create_correlation_heatmap(correlation_matrix)
+        chart_path = self._create_correlation_heatmap_png(correlation_matrix)
         
         # Find strong correlations
         strong_corr = []
-        for i in range(len(correlation_matrix.columns)):
-            for j in range(i+1, len(correlation_matrix.columns)):
-                corr_val = correlation_matrix.iloc[i, j]
-                if abs(corr_val) > 0.5:
-                    strong_corr.append({
-                        'var1': correlation_matrix.columns[i],
-                        'var2': correlation_matrix.columns[j],
-                        'correlation': round(corr_val, 3)
-                    })
+        for var1, var2, corr_val in self._correlated_pairs(correlation_matrix, 0.5):
+            strong_corr.append({
+                'var1': var1,
+                'var2': var2,
+                'correlation': round(corr_val, 3)
+            })
         
-        return {
+        result = {
             "analysis_type": "correlation",
             "correlation_matrix": correlation_matrix.to_dict(),
             "strong_correlations": strong_corr,
             "chart_path": chart_path,
             "insights": f"Found {len(strong_corr)} strong correlations (|r| > 0.5)"
         }
+        if key is not None:
+            self._correlation_analysis_cache = {key: result}
+        return dict(result)
     
     def _analyze_trends(self, query: str) -> Dict[str, Any]:
         """Analyze trends in data"""
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._num_cols
         
         if len(numeric_cols) == 0:
             return {"error": "No numeric columns for trend analysis"}
@@ -1108,6 +1794,11 @@ class DataService(SerializationMixin):
         # Simple trend analysis - assume first column is time-like or use index
         x_data = range(len(self.current_data))
         y_data = self.current_data[numeric_cols[0]]
+        # The slope is fitted over the non-missing values, as _temporal_analysis
+        # does; NaN would make it NaN
+        values = y_data.dropna()
+        if len(values) < 2:
+            return {"error": f"Not enough values in {numeric_cols[0]} for trend analysis"}
         
         chart_path = self._create_line_chart(
             x=x_data,
@@ -1118,7 +1809,7 @@ class DataService(SerializationMixin):
         )
         
         # Calculate basic trend metrics
-        slope = np.polyfit(x_data, y_data, 1)[0]
+        slope = self._linear_slope(values.to_numpy(dtype=np.float64))
         trend_direction = "increasing" if slope > 0 else "decreasing"
         
         return {
@@ -1131,7 +1822,7 @@ class DataService(SerializationMixin):
     
     def _analyze_distribution(self, query: str) -> Dict[str, Any]:
         """Analyze data distribution"""
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._num_cols
         
         if len(numeric_cols) == 0:
             return {"error": "No numeric columns for distribution analysis"}
@@ -1143,14 +1834,15 @@ class DataService(SerializationMixin):
         chart_path = self._create_histogram(data, col)
         
         # Calculate distribution statistics
+        row = self._profile().loc[col]
         stats = {
-            "mean": float(data.mean()),
-            "median": float(data.median()),
-            "std": float(data.std()),
-            "min": float(data.min()),
-            "max": float(data.max()),
-            "skewness": float(data.skew()),
-            "kurtosis": float(data.kurtosis())
+            "mean": float(row['mean']),
+            "median": float(row['50%']),
+            "std": float(row['std']),
+            "min": float(row['min']),
+            "max": float(row['max']),
+            "skewness": float(row['skew']),
+            "kurtosis": float(row['kurt'])
         }
         
         return {
@@ -1162,13 +1854,21 @@ class DataService(SerializationMixin):
         }
     
     def _generate_summary(self) -> Dict[str, Any]:
-        """Generate dataset summary"""
-        summary = self.current_data.describe(include='all').to_dict()
+        """Generate dataset summary.
+
+        The result (chart included) is cached per dataset like
+        _analyze_correlation; callers get a shallow copy.
+        """
+        key = self._data_fingerprint
+        if key is not None and key in self._summary_analysis_cache:
+            return dict(self._summary_analysis_cache[key])
+        
+        summary = self._describe_all()
         
         # Create summary visualization
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._num_cols
         if len(numeric_cols) > 0:
-            means = self.current_data[numeric_cols].mean()
+            means = self._profile().loc[numeric_cols, 'mean']
             chart_path = self._create_bar_chart(
                 x=list(means.index),
                 y=list(means.values),
@@ -1179,89 +1879,109 @@ class DataService(SerializationMixin):
         else:
             chart_path = None
         
-        return {
+        result = {
             "analysis_type": "summary",
             "summary_statistics": summary,
             "data_info": self.data_info,
             "chart_path": chart_path,
             "insights": f"Dataset with {self.data_info['total_rows']} rows and {self.data_info['total_columns']} columns"
         }
+        if key is not None:
+            self._summary_analysis_cache = {key: result}
+        return dict(result)
     
+    def _describe_all(self) -> Dict[str, Dict[str, Any]]:
+        """describe(include='all').to_dict(), assembled from the cached profile and value counts.
+
+        Numeric columns take count/mean/std/min/quartiles/max from the profile
+        and text columns count/unique/top/freq from _value_counts, so no
+        second describe or per-column value_counts pass runs. Frames with
+        other dtypes (bool, datetime, category) go through describe itself.
+        """
+        df = self.current_data
+        if len(self._num_cols) + len(self._cat_cols) != len(df.columns) or not len(df.columns):
+            return df.describe(include='all').to_dict()
+
+        profile = self._profile()
+        numeric_stats = ('count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max')
+        text_stats = ('count', 'unique', 'top', 'freq')
+        # describe's row order; it lists only the statistics of dtypes present
+        if not self._cat_cols:
+            order = numeric_stats
+        elif not self._num_cols:
+            order = text_stats
+        else:
+            order = text_stats + numeric_stats[1:]
+
+        self._prime_value_counts(self._cat_cols)
+        numeric = set(self._num_cols)
+        summary = {}
+        for col in df.columns:
+            if col in numeric:
+                values = {stat: float(profile.at[col, stat]) for stat in numeric_stats}
+            else:
+                counts = self._value_counts(col)
+                values = {
+                    'count': len(df) - int(profile.at[col, 'missing']),
+                    'unique': int(profile.at[col, 'nunique']),
+                    'top': counts.index[0] if len(counts) else np.nan,
+                    'freq': int(counts.iloc[0]) if len(counts) else np.nan,
+                }
+            summary[col] = {stat: values.get(stat, np.nan) for stat in order}
+        return summary
+
     def _general_analysis(self, query: str) -> Dict[str, Any]:
         """General analysis fallback"""
         return self._generate_summary()
     
-    def _create_bar_chart(self, x, y, title, xlabel, ylabel) -> str:
-        """Create bar chart and return file path"""
-        plt.figure(figsize=(10, 6))
-        plt.bar(x, y, color='#00ff9f', alpha=0.7)
-        plt.title(title, color='white', fontsize=16)
-        plt.xlabel(xlabel, color='white')
-        plt.ylabel(ylabel, color='white')
-        plt.xticks(rotation=45, color='white')
-        plt.yticks(color='white')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        filename = f"bar_chart_{uuid.uuid4().hex[:8]}.png"
+    def _render_chart(self, prefix: str, draw, *args) -> str:
+        """Render a _draw_* chart into static_dir and return its filename.
+
+        The filename is a hash of the chart's inputs, so a repeated query
+        (same dataset, same columns) finds its PNG already on disk and skips
+        the render.
+        """
+        try:
+            digest = hashlib.blake2b(pickle.dumps(args, protocol=pickle.HIGHEST_PROTOCOL), digest_size=8).hexdigest()
+        except Exception:  # unpicklable labels; render under a one-off name
+            digest = uuid.uuid4().hex[:16]
+        filename = f"{prefix}_{digest}.png"
         filepath = os.path.join(self.static_dir, filename)
-        plt.savefig(filepath, facecolor='#1a1a2e', dpi=150, bbox_inches='tight')
-        plt.close()
-        
+        if not os.path.exists(filepath):
+            # Draw under a temporary name and rename into place, so a concurrent
+            # identical query or a failed render never leaves a partial PNG
+            # behind the final (immutably cached) name
+            fd, tmp_path = tempfile.mkstemp(suffix='.png', dir=self.static_dir)
+            os.close(fd)
+            try:
+                _render_png(draw, tmp_path, *args)
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
         return filename
+
+    def _create_bar_chart(self, x, y, title, xlabel, ylabel) -> str:
+        """Create bar chart and return file path"""
+        return self._render_chart("bar_chart", _draw_bar_chart, x, y, title, xlabel, ylabel)
     
     def _create_line_chart(self, x, y, title, xlabel, ylabel) -> str:
         """Create line chart and return file path"""
-        plt.figure(figsize=(10, 6))
-        plt.plot(x, y, color='#00ff9f', linewidth=2, marker='o', markersize=4)
-        plt.title(title, color='white', fontsize=16)
-        plt.xlabel(xlabel, color='white')
-        plt.ylabel(ylabel, color='white')
-        plt.xticks(color='white')
-        plt.yticks(color='white')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        filename = f"line_chart_{uuid.uuid4().hex[:8]}.png"
-        filepath = os.path.join(self.static_dir, filename)
-        plt.savefig(filepath, facecolor='#1a1a2e', dpi=150, bbox_inches='tight')
-        plt.close()
-        
-        return filename
+        return self._render_chart("line_chart", _draw_line_chart, x, y, title, xlabel, ylabel)
     
-    def _create_correlation_heatmap(self, corr_matrix) -> str:
+    def _create_correlation_heatmap_png(self, corr_matrix) -> str:
         """Create correlation heatmap"""
-        plt.figure(figsize=(10, 8))
-        sns.heatmap(corr_matrix, annot=True, cmap='viridis', center=0,
-                   square=True, linewidths=0.5, cbar_kws={"shrink": .5})
-        plt.title('Correlation Matrix', color='white', fontsize=16)
-        plt.tight_layout()
-        
-        filename = f"heatmap_{uuid.uuid4().hex[:8]}.png"
-        filepath = os.path.join(self.static_dir, filename)
-        plt.savefig(filepath, facecolor='#1a1a2e', dpi=150, bbox_inches='tight')
-        plt.close()
-        
-        return filename
+        return self._render_chart("heatmap", _draw_correlation_heatmap, corr_matrix)
     
     def _create_histogram(self, data, column_name) -> str:
-        """Create histogram"""
-        plt.figure(figsize=(10, 6))
-        plt.hist(data, bins=30, color='#00ff9f', alpha=0.7, edgecolor='white')
-        plt.title(f'Distribution of {column_name}', color='white', fontsize=16)
-        plt.xlabel(column_name, color='white')
-        plt.ylabel('Frequency', color='white')
-        plt.xticks(color='white')
-        plt.yticks(color='white')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        filename = f"histogram_{uuid.uuid4().hex[:8]}.png"
-        filepath = os.path.join(self.static_dir, filename)
-        plt.savefig(filepath, facecolor='#1a1a2e', dpi=150, bbox_inches='tight')
-        plt.close()
-        
-        return filename
+        """Create histogram.
+
+        The bins are counted here with np.histogram (what plt.hist does
+        internally), so only 30 counts and 31 edges reach the renderer, which
+        may be another process, instead of the whole column.
+        """
+        counts, edges = np.histogram(np.asarray(data, dtype=np.float64), bins=30)
+        return self._render_chart("histogram", _draw_histogram, counts, edges, column_name)
     
     # Helper methods for enhanced analytics
     def _get_quality_recommendations(self, column_quality: Dict) -> List[str]:
@@ -1373,33 +2093,23 @@ class DataService(SerializationMixin):
     
     def _get_highest_correlation(self, corr_matrix, positive=True) -> Dict[str, Any]:
         """Get highest correlation from matrix"""
-        # Create a mask to ignore diagonal and duplicates
-        mask = np.triu(np.ones_like(corr_matrix, dtype=bool))
-        corr_values = corr_matrix.mask(mask)
-        
-        if positive:
-            max_corr = corr_values.max().max()
-            if pd.isna(max_corr):
-                return None
-            max_pos = corr_values.stack().idxmax()
-        else:
-            min_corr = corr_values.min().min()
-            if pd.isna(min_corr):
-                return None
-            max_pos = corr_values.stack().idxmin()
-            max_corr = min_corr
+        # Strictly-lower triangle (ignores the diagonal and duplicates), in the
+        # same row-major order stack() would list it, searched in NumPy
+        values = corr_matrix.to_numpy()
+        rows, cols = np.tril_indices_from(values, k=-1)
+        flat = values[rows, cols]
+        if flat.size == 0 or np.isnan(flat).all():
+            return None
+        k = int(np.nanargmax(flat) if positive else np.nanargmin(flat))
         
         return {
-            "variable_1": max_pos[0],
-            "variable_2": max_pos[1], 
-            "correlation": float(max_corr)
+            "variable_1": corr_matrix.index[rows[k]],
+            "variable_2": corr_matrix.columns[cols[k]],
+            "correlation": float(flat[k])
         }
     
-    def _identify_distribution_type(self, data) -> str:
-        """Identify the type of distribution"""
-        skewness = data.skew()
-        kurtosis = data.kurtosis()
-        
+    def _identify_distribution_type(self, skewness: float, kurtosis: float) -> str:
+        """Identify the type of distribution from its skewness and excess kurtosis"""
         if abs(skewness) < 0.5 and abs(kurtosis) < 3:
             return "approximately_normal"
         elif skewness > 1:
@@ -1411,15 +2121,15 @@ class DataService(SerializationMixin):
         else:
             return "unknown"
     
-    def _test_normality(self, data) -> Dict[str, Any]:
+    def _test_normality(self, count: int, skewness: float, kurtosis: float) -> Dict[str, Any]:
         """Test if data follows normal distribution"""
-        if len(data) < 3:
+        if count < 3:
             return {"test": "insufficient_data"}
         
         try:
             # Simple normality test based on skewness and kurtosis
-            skewness = abs(data.skew())
-            kurtosis = abs(data.kurtosis())
+            skewness = abs(skewness)
+            kurtosis = abs(kurtosis)
             
             is_normal = skewness < 1 and kurtosis < 3
             return {
@@ -1430,28 +2140,12 @@ class DataService(SerializationMixin):
         except:
             return {"test": "failed"}
     
-    def _detect_outliers_column(self, data) -> Dict[str, Any]:
-        """Detect outliers in a single column"""
-        q1 = data.quantile(0.25)
-        q3 = data.quantile(0.75)
-        iqr = q3 - q1
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
-        
-        outliers = data[(data < lower_bound) | (data > upper_bound)]
-        
-        return {
-            "outlier_count": len(outliers),
-            "outlier_percentage": float(len(outliers) / len(data) * 100),
-            "lower_bound": float(lower_bound),
-            "upper_bound": float(upper_bound),
-            "outlier_values": outliers.tolist()[:10]  # Limit to first 10
-        }
-    
     def _calculate_diversity_index(self, value_counts) -> float:
         """Calculate diversity index for categorical data"""
-        proportions = value_counts / value_counts.sum()
-        return float(-np.sum(proportions * np.log(proportions + 1e-10)))  # Shannon entropy
+        counts = value_counts.to_numpy(dtype=np.float64)
+        if not counts.sum():
+            return 0.0
+        return float(stats.entropy(counts))  # Shannon entropy (nats); normalizes and skips zero counts
     
     def _create_distribution_chart(self, column: str) -> Dict[str, Any]:
         """Create distribution chart data for plotly"""
@@ -1460,15 +2154,12 @@ class DataService(SerializationMixin):
             return None
         
         try:
-            fig = px.histogram(x=col_data, nbins=30, title=f'Distribution of {column}')
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='white'
-            )
+            # Binned here, so the figure carries 30 bars rather than every raw value
+            counts, edges = np.histogram(col_data.to_numpy(dtype=np.float64), bins=30)
             return {
                 "type": "histogram",
-                "data": fig.to_json(),
+                "data": _plotly_bar_json(((edges[:-1] + edges[1:]) / 2).tolist(), counts.tolist(),
+                                         f'Distribution of {column}', width=np.diff(edges).tolist()),
                 "column": column
             }
         except:
@@ -1476,12 +2167,12 @@ class DataService(SerializationMixin):
     
     def _create_correlation_heatmap(self) -> Dict[str, Any]:
         """Create correlation heatmap data for plotly"""
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._num_cols
         if len(numeric_cols) < 2:
             return None
         
         try:
-            corr_matrix = self.current_data[numeric_cols].corr()
+            corr_matrix = self._corr()
             fig = px.imshow(corr_matrix, text_auto=True, aspect="auto", 
                           title="Correlation Heatmap")
             fig.update_layout(
@@ -1498,42 +2189,30 @@ class DataService(SerializationMixin):
     
     def _create_missing_values_chart(self) -> Dict[str, Any]:
         """Create missing values visualization"""
-        missing_counts = self.current_data.isnull().sum()
+        missing_counts = self._profile()['missing']
         missing_counts = missing_counts[missing_counts > 0]
         
         if len(missing_counts) == 0:
             return {"message": "No missing values found"}
         
         try:
-            fig = px.bar(x=missing_counts.index, y=missing_counts.values,
-                        title="Missing Values by Column")
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='white'
-            )
             return {
                 "type": "bar",
-                "data": fig.to_json()
+                "data": _plotly_bar_json(missing_counts.index.tolist(), missing_counts.tolist(),
+                                         "Missing Values by Column")
             }
         except:
             return None
     
     def _create_category_chart(self, column: str) -> Dict[str, Any]:
         """Create category distribution chart"""
-        value_counts = self.current_data[column].value_counts().head(10)
+        value_counts = self._value_counts(column).head(10)
         
         try:
-            fig = px.bar(x=value_counts.index, y=value_counts.values,
-                        title=f'Top Categories in {column}')
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='white'
-            )
             return {
                 "type": "bar",
-                "data": fig.to_json(),
+                "data": _plotly_bar_json(value_counts.index.tolist(), value_counts.tolist(),
+                                         f'Top Categories in {column}'),
                 "column": column
             }
         except:
@@ -1545,29 +2224,30 @@ class DataService(SerializationMixin):
             return {"error": f"Column '{column}' not found"}
         
         col_data = self.current_data[column]
+        missing = int(self._profile().at[column, 'missing'])
         info = {
             "name": column,
             "data_type": str(col_data.dtype),
             "total_values": len(col_data),
-            "non_null_values": int(col_data.count()),
-            "null_values": int(col_data.isnull().sum()),
-            "unique_values": int(col_data.nunique())
+            "non_null_values": len(col_data) - missing,
+            "null_values": missing,
+            "unique_values": int(self._profile().at[column, 'nunique'])
         }
         
-        if col_data.dtype in ['int64', 'float64']:
-            col_clean = col_data.dropna()
-            if len(col_clean) > 0:
+        if self._is_int_or_float(col_data.dtype):
+            row = self._profile().loc[column]
+            if row['count'] > 0:
                 info.update({
-                    "min": float(col_clean.min()),
-                    "max": float(col_clean.max()),
-                    "mean": float(col_clean.mean()),
-                    "median": float(col_clean.median()),
-                    "std": float(col_clean.std())
+                    "min": float(row['min']),
+                    "max": float(row['max']),
+                    "mean": float(row['mean']),
+                    "median": float(row['50%']),
+                    "std": float(row['std'])
                 })
         else:
             info.update({
-                "most_common": col_data.value_counts().head(5).to_dict(),
-                "sample_values": col_data.dropna().head(10).tolist()
+                "most_common": self._value_counts(column).head(5).to_dict(),
+                "sample_values": self._first_non_null(col_data, 10)
             })
         
         return info
@@ -1599,22 +2279,25 @@ class DataService(SerializationMixin):
         issues = {}
         if self.current_data is None:
             return issues
-        for col in self.current_data.columns:
-            series = self.current_data[col]
-            non_null = series.dropna()
-            if len(non_null) == 0:
-                continue
-            unique_ratio = non_null.nunique() / len(non_null)
-            if unique_ratio < 0.02:  # Very low uniqueness
+        # Counts come from the cached profile; a constant column's value is
+        # the single entry of its cached value counts
+        profile = self._profile()
+        non_null = len(self.current_data) - profile['missing']
+        present = non_null > 0
+        unique_ratio = profile['nunique'] / non_null.where(present)
+        low_variance = present & (unique_ratio < 0.02)  # Very low uniqueness
+        constant = present & ~low_variance & (profile['nunique'] == 1)
+        for col in profile.index[low_variance | constant]:
+            if low_variance[col]:
                 issues[col] = {
                     "issue": "low_variance",
-                    "unique_ratio": float(unique_ratio),
-                    "unique_values": int(non_null.nunique())
+                    "unique_ratio": float(unique_ratio[col]),
+                    "unique_values": int(profile.at[col, 'nunique'])
                 }
-            elif non_null.nunique() == 1:
+            else:
                 issues[col] = {
                     "issue": "constant_column",
-                    "value": non_null.iloc[0]
+                    "value": self._value_counts(col).index[0]
                 }
         return issues
 
@@ -1622,31 +2305,16 @@ class DataService(SerializationMixin):
         """Backward-compatible wrapper for outlier detection used earlier"""
         if self.current_data is None or column not in self.current_data.columns:
             return {}
-        col_data = self.current_data[column].dropna()
-        if col_data.dtype not in ['int64', 'float64'] or len(col_data) < 5:
+        if not self._is_int_or_float(self.current_data[column].dtype) or self._profile().at[column, 'count'] < 5:
             return {"outlier_count": 0}
-        return self._detect_outliers_column(col_data)
+        return self._iqr_outliers()[column]
 
     def _infer_dataset_type(self) -> str:
         """Infer the type of dataset based on columns and content"""
         if self.current_data is None:
             return "unknown"
-        
-        columns = [col.lower() for col in self.current_data.columns]
-        
-        # Check for common dataset types
-        if any(word in ' '.join(columns) for word in ['sales', 'revenue', 'price', 'amount']):
-            return "sales_data"
-        elif any(word in ' '.join(columns) for word in ['employee', 'staff', 'hr', 'salary']):
-            return "hr_data"
-        elif any(word in ' '.join(columns) for word in ['traffic', 'visits', 'pageviews', 'clicks']):
-            return "web_analytics"
-        elif any(word in ' '.join(columns) for word in ['temperature', 'humidity', 'weather']):
-            return "weather_data"
-        elif any(word in ' '.join(columns) for word in ['stock', 'market', 'trading']):
-            return "financial_data"
-        else:
-            return "general_data"
+        # Matched against the column names once per load by _index_column_types
+        return self._dataset_type
 
     def _suggest_analyses(self) -> List[str]:
         """Suggest potential analyses based on data characteristics"""
@@ -1654,8 +2322,8 @@ class DataService(SerializationMixin):
             return []
         
         suggestions = []
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
-        categorical_cols = self.current_data.select_dtypes(include=['object']).columns
+        numeric_cols = self._num_cols
+        categorical_cols = self._cat_cols
         
         if len(numeric_cols) > 1:
             suggestions.extend([
@@ -1681,19 +2349,15 @@ class DataService(SerializationMixin):
             return []
         
         relationships = []
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._num_cols
         
         if len(numeric_cols) > 1:
             # Calculate correlation matrix
-            corr_matrix = self.current_data[numeric_cols].corr()
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    corr_val = corr_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.5:  # Significant correlation
-                        relationships.append(
-                            f"{corr_matrix.columns[i]} and {corr_matrix.columns[j]} "
-                            f"({'positive' if corr_val > 0 else 'negative'} correlation: {corr_val:.3f})"
-                        )
+            for var1, var2, corr_val in self._correlated_pairs(self._corr(), 0.5):  # Significant correlation
+                relationships.append(
+                    f"{var1} and {var2} "
+                    f"({'positive' if corr_val > 0 else 'negative'} correlation: {corr_val:.3f})"
+                )
         
         return relationships
 
@@ -1702,7 +2366,6 @@ class DataService(SerializationMixin):
         if self.current_data is None:
             return "Unknown business context"
         
-        columns = [col.lower() for col in self.current_data.columns]
         dataset_type = self._infer_dataset_type()
         
         contexts = {
@@ -1721,8 +2384,8 @@ class DataService(SerializationMixin):
             return []
         
         recommendations = []
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
-        categorical_cols = self.current_data.select_dtypes(include=['object']).columns
+        numeric_cols = self._num_cols
+        categorical_cols = self._cat_cols
         
         if len(numeric_cols) >= 2:
             recommendations.extend([
@@ -1751,9 +2414,9 @@ class DataService(SerializationMixin):
             return "No data available"
         
         shape = self.current_data.shape
-        numeric_cols = len(self.current_data.select_dtypes(include=[np.number]).columns)
-        categorical_cols = len(self.current_data.select_dtypes(include=['object']).columns)
-        missing_pct = (self.current_data.isnull().sum().sum() / (shape[0] * shape[1])) * 100
+        numeric_cols = len(self._num_cols)
+        categorical_cols = len(self._cat_cols)
+        missing_pct = self._missing_percentage()
         
         story = f"This dataset contains {shape[0]} records with {shape[1]} variables. "
         story += f"It includes {numeric_cols} numeric and {categorical_cols} categorical variables. "
@@ -1780,8 +2443,8 @@ class DataService(SerializationMixin):
         summary_parts.append(f"Dataset with {self.current_data.shape[0]} rows and {self.current_data.shape[1]} columns")
         
         # Data types summary
-        numeric_count = len(self.current_data.select_dtypes(include=[np.number]).columns)
-        categorical_count = len(self.current_data.select_dtypes(include=['object']).columns)
+        numeric_count = len(self._num_cols)
+        categorical_count = len(self._cat_cols)
         
         if numeric_count > 0:
             summary_parts.append(f"{numeric_count} numeric columns for quantitative analysis")
@@ -1789,7 +2452,7 @@ class DataService(SerializationMixin):
             summary_parts.append(f"{categorical_count} categorical columns for segmentation")
         
         # Data quality note
-        missing_pct = (self.current_data.isnull().sum().sum() / (self.current_data.shape[0] * self.current_data.shape[1])) * 100
+        missing_pct = self._missing_percentage()
         if missing_pct > 10:
             summary_parts.append(f"⚠️ {missing_pct:.1f}% missing values detected")
         elif missing_pct > 0:
@@ -1804,7 +2467,7 @@ class DataService(SerializationMixin):
         if self.current_data is None:
             return {}
         
-        missing_data = self.current_data.isnull().sum()
+        missing_data = self._profile()['missing']
         missing_percentage = (missing_data / len(self.current_data)) * 100
         
         return {
@@ -1812,7 +2475,7 @@ class DataService(SerializationMixin):
             "missing_percentages": missing_percentage.to_dict(),
             "total_missing": int(missing_data.sum()),
             "columns_with_missing": missing_data[missing_data > 0].index.tolist(),
-            "complete_rows": int(len(self.current_data) - self.current_data.isnull().any(axis=1).sum())
+            "complete_rows": self._row_stats()['complete_rows']
         }
 
     def _detect_outliers_comprehensive(self) -> Dict[str, Any]:
@@ -1820,32 +2483,10 @@ class DataService(SerializationMixin):
         if self.current_data is None:
             return {}
         
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
-        outlier_info = {}
-        
-        for col in numeric_cols:
-            col_data = self.current_data[col].dropna()
-            if len(col_data) < 5:
-                continue
-                
-            # IQR method
-            Q1 = col_data.quantile(0.25)
-            Q3 = col_data.quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            
-            outliers = col_data[(col_data < lower_bound) | (col_data > upper_bound)]
-            
-            outlier_info[col] = {
-                "outlier_count": len(outliers),
-                "outlier_percentage": (len(outliers) / len(col_data)) * 100,
-                "lower_bound": lower_bound,
-                "upper_bound": upper_bound,
-                "outlier_values": outliers.tolist()[:10]  # First 10 outliers
-            }
-        
-        return outlier_info
+        # IQR method; skip columns with too few values to judge
+        profile = self._profile()
+        return {col: info for col, info in self._iqr_outliers().items()
+                if profile.at[col, 'count'] >= 5}
 
     # =============================
     # Missing AI/analysis helper methods (added to fix attribute errors)
@@ -1861,9 +2502,9 @@ class DataService(SerializationMixin):
         if self.current_data is None:
             return {"error": "No dataset loaded"}
 
-        cache_key = 'comprehensive'
-        if cache_key in self.insights_cache:
-            return self.insights_cache[cache_key]
+        key = self._data_fingerprint
+        if key is not None and key in self.insights_cache:
+            return self.insights_cache[key]
 
         info = self.data_info or self._generate_data_info()
         numeric_cols = info.get('numeric_columns', [])
@@ -1879,7 +2520,8 @@ class DataService(SerializationMixin):
             "narrative": self._compose_insights_narrative(info)
         }
 
-        self.insights_cache[cache_key] = insights
+        if key is not None:
+            self.insights_cache = {key: insights}
         return insights
 
     def _generate_ai_insights(self, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
@@ -1921,64 +2563,49 @@ class DataService(SerializationMixin):
     def _get_distribution_summary(self, column: str) -> Dict[str, Any]:
         if self.current_data is None or column not in self.current_data.columns:
             return {}
-        series = self.current_data[column].dropna()
-        if series.empty or series.dtype not in [np.float64, np.int64]:
+        if not self._is_int_or_float(self.current_data[column].dtype):
+            return {}
+        row = self._profile().loc[column]
+        if row['count'] == 0:
             return {}
         return {
-            "mean": float(series.mean()),
-            "std": float(series.std()),
-            "min": float(series.min()),
-            "max": float(series.max()),
-            "skew": float(series.skew()),
-            "kurtosis": float(series.kurtosis())
+            "mean": float(row['mean']),
+            "std": float(row['std']),
+            "min": float(row['min']),
+            "max": float(row['max']),
+            "skew": float(row['skew']),
+            "kurtosis": float(row['kurt'])
         }
 
     def _get_specific_correlations(self, columns: List[str]) -> Dict[str, Any]:
-        numeric_cols = [c for c in columns if c in self.current_data.select_dtypes(include=[np.number]).columns]
+        numeric_cols = [c for c in columns if c in self._num_cols]
         if len(numeric_cols) < 2:
             return {"message": "Need at least two numeric columns"}
-        corr = self.current_data[numeric_cols].corr()
-        pairs = []
-        for i, c1 in enumerate(numeric_cols):
-            for c2 in numeric_cols[i+1:]:
-                pairs.append({"variable_1": c1, "variable_2": c2, "correlation": float(corr.loc[c1, c2])})
+        corr = self._corr().loc[numeric_cols, numeric_cols]
+        pairs = [{"variable_1": c1, "variable_2": c2, "correlation": float(val)}
+                 for c1, c2, val in self._correlated_pairs(corr, -1.0)]  # every non-NaN pair
         return {"correlations": sorted(pairs, key=lambda x: abs(x['correlation']), reverse=True)}
 
     def _get_top_correlations(self) -> Dict[str, Any]:
-        numeric = self.current_data.select_dtypes(include=[np.number])
-        if numeric.shape[1] < 2:
+        if len(self._num_cols) < 2:
             return {"message": "Not enough numeric columns"}
-        corr = numeric.corr()
-        pairs = []
-        cols = list(corr.columns)
-        for i in range(len(cols)):
-            for j in range(i+1, len(cols)):
-                val = float(corr.iloc[i, j])
-                pairs.append({"variable_1": cols[i], "variable_2": cols[j], "correlation": val})
-        pairs.sort(key=lambda x: abs(x['correlation']), reverse=True)
-        return {"correlations": pairs[:5]}
+        pairs = [{"variable_1": c1, "variable_2": c2, "correlation": float(val)}
+                 for c1, c2, val in self._correlated_pairs(self._corr(), -1.0, top=5)]  # strongest non-NaN pairs
+        return {"correlations": pairs}
 
     def _get_missing_data_analysis(self) -> Dict[str, Any]:
         if self.current_data is None:
             return {}
-        miss = self.current_data.isnull().sum()
+        miss = self._profile()['missing']
         total = int(miss.sum())
         return {"total_missing": total, "columns": miss[miss > 0].to_dict()}
 
     def _get_outlier_analysis(self) -> Dict[str, Any]:
-        numeric_cols = self.current_data.select_dtypes(include=[np.number]).columns
-        out = {}
-        for col in numeric_cols:
-            out[col] = self._detect_outliers_column(self.current_data[col].dropna())
-        return out
+        return self._iqr_outliers()
 
     def _analyze_query_intent(self, query: str) -> Dict[str, Any]:
         q = query.lower()
-        intents = []
-        if any(k in q for k in ['trend','over time']): intents.append('trend')
-        if 'correl' in q: intents.append('correlation')
-        if any(k in q for k in ['average','mean','median']): intents.append('statistics')
-        if any(k in q for k in ['outlier','anomal','unusual']): intents.append('anomaly')
+        intents = [name for name, pattern in _QUERY_CONTEXT_INTENTS if pattern.search(q)]
         return {"intents": intents or ['general']}
 
     def _suggest_related_analyses(self, query: str, result: Dict[str, Any]) -> List[str]:
@@ -1997,17 +2624,13 @@ class DataService(SerializationMixin):
         return suggestions
 
     def _smart_correlation_analysis(self, mentioned_columns: List[str]) -> Optional[Dict[str, Any]]:
-        numeric = self.current_data.select_dtypes(include=[np.number])
-        if numeric.shape[1] < 2:
+        numeric_cols = self._num_cols
+        if len(numeric_cols) < 2:
             return None
-        target_cols = [c for c in mentioned_columns if c in numeric.columns] or list(numeric.columns[:3])
-        corr = numeric[target_cols].corr()
-        strong = []
-        for i, c1 in enumerate(target_cols):
-            for c2 in target_cols[i+1:]:
-                val = float(corr.loc[c1, c2])
-                if abs(val) > 0.4:
-                    strong.append({'var1': c1, 'var2': c2, 'correlation': round(val,3)})
+        target_cols = [c for c in mentioned_columns if c in numeric_cols] or numeric_cols[:3]
+        corr = self._corr().loc[target_cols, target_cols]
+        strong = [{'var1': c1, 'var2': c2, 'correlation': round(float(val), 3)}
+                  for c1, c2, val in self._correlated_pairs(corr, 0.4)]
         return {
             'analysis_type': 'correlation',
             'correlation_matrix': corr.to_dict(),
@@ -2017,15 +2640,14 @@ class DataService(SerializationMixin):
 
     def _temporal_analysis(self, query: str, mentioned_columns: List[str]) -> Optional[Dict[str, Any]]:
         # Basic temporal analysis using index as time surrogate
-        numeric = self.current_data.select_dtypes(include=[np.number])
-        if numeric.empty:
+        numeric_cols = self._num_cols
+        if not numeric_cols:
             return None
-        col = mentioned_columns[0] if mentioned_columns and mentioned_columns[0] in numeric.columns else numeric.columns[0]
-        series = numeric[col].dropna()
+        col = mentioned_columns[0] if mentioned_columns and mentioned_columns[0] in numeric_cols else numeric_cols[0]
+        series = self.current_data[col].dropna()
         if len(series) < 3:
             return None
-        x = np.arange(len(series))
-        slope = np.polyfit(x, series, 1)[0]
+        slope = self._linear_slope(series.to_numpy(dtype=np.float64))
         return {
             'analysis_type': 'trend',
             'slope': float(slope),
@@ -2034,32 +2656,32 @@ class DataService(SerializationMixin):
         }
 
     def _categorical_breakdown(self, mentioned_columns: List[str]) -> Optional[Dict[str, Any]]:
-        cats = self.current_data.select_dtypes(include=['object'])
-        if cats.empty:
+        cat_cols = self._cat_cols
+        if not cat_cols or self.current_data.empty:
             return None
         col = None
         for c in mentioned_columns:
-            if c in cats.columns:
+            if c in cat_cols:
                 col = c
                 break
-        col = col or cats.columns[0]
-        counts = cats[col].value_counts().head(10)
+        col = col or cat_cols[0]
+        all_counts = self._value_counts(col)
+        counts = all_counts.head(10)
         return {
             'analysis_type': 'categorical_breakdown',
             'column': col,
             'top_categories': counts.to_dict(),
-            'insights': f"Top category '{counts.index[0]}' represents {counts.iloc[0] / counts.sum() * 100:.1f}% of records"
+            'insights': f"Top category '{counts.index[0]}' represents {counts.iloc[0] / len(self.current_data) * 100:.1f}% of records"
         }
 
     def _detect_anomalies(self, mentioned_columns: List[str]) -> Optional[Dict[str, Any]]:
-        numeric = self.current_data.select_dtypes(include=[np.number])
-        if numeric.empty:
+        numeric_cols = self._num_cols
+        if not numeric_cols:
             return None
-        col = mentioned_columns[0] if mentioned_columns and mentioned_columns[0] in numeric.columns else numeric.columns[0]
-        series = numeric[col].dropna()
-        if len(series) < 5:
+        col = mentioned_columns[0] if mentioned_columns and mentioned_columns[0] in numeric_cols else numeric_cols[0]
+        if self._profile().at[col, 'count'] < 5:
             return None
-        outinfo = self._detect_outliers_column(series)
+        outinfo = self._iqr_outliers()[col]
         return {
             'analysis_type': 'anomaly_detection',
             'column': col,
@@ -2070,25 +2692,17 @@ class DataService(SerializationMixin):
     # ---- Internal helpers for insights assembly ----
     def _rank_numeric_by_std(self, numeric_cols: List[str]) -> List[Dict[str, Any]]:
         ranked = []
+        profile = self._profile()
         for c in numeric_cols:
-            series = self.current_data[c].dropna()
-            if len(series) > 1:
-                ranked.append({"column": c, "std": float(series.std()), "mean": float(series.mean())})
+            if profile.at[c, 'count'] > 1:
+                ranked.append({"column": c, "std": float(profile.at[c, 'std']), "mean": float(profile.at[c, 'mean'])})
         return sorted(ranked, key=lambda x: x['std'], reverse=True)
 
     def _get_correlation_highlights(self) -> List[Dict[str, Any]]:
-        numeric = self.current_data.select_dtypes(include=[np.number])
-        if numeric.shape[1] < 2:
+        if len(self._num_cols) < 2:
             return []
-        corr = numeric.corr()
-        highlights = []
-        cols = list(corr.columns)
-        for i in range(len(cols)):
-            for j in range(i+1, len(cols)):
-                val = float(corr.iloc[i, j])
-                if abs(val) >= 0.6:
-                    highlights.append({"var1": cols[i], "var2": cols[j], "correlation": round(val,3)})
-        return sorted(highlights, key=lambda x: abs(x['correlation']), reverse=True)[:5]
+        return [{"var1": c1, "var2": c2, "correlation": round(float(val), 3)}
+                for c1, c2, val in self._correlated_pairs(self._corr(), 0.6, top=5, inclusive=True)]
 
     def _get_recommended_next_steps(self) -> List[str]:
         steps = []
@@ -1,9 +1,33 @@
 import os
+import re
+import hashlib
+import threading
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:  # explain_insights falls back to the stdlib encoder
+    orjson = None
+
+# One pooled session per process: every Gemini call reuses an already
+# established TLS connection instead of paying a fresh handshake.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# Markdown cleanup patterns for GeminiService._clean_response
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.*?)\*')
+_OPTION_HEADER_RE = re.compile(r'\*\*(?:Option|\w+:)')  # '**Option 1', '**Note:' ... line starts
+_EXTRA_BLANKS_RE = re.compile(r'\n\s*\n\s*\n')
+
 class GeminiService:
+    # Successful responses kept per process, keyed by model + prompt; oldest evicted first
+    RESPONSE_CACHE_SIZE = 128
+
     def __init__(self):
         # Load API key and model configuration
         self.api_key = os.getenv('GEMINI_API_KEY')
@@ -18,6 +42,26 @@ class GeminiService:
         self.models = list(dict.fromkeys(self.models))
         self.current_model = self.models[0]
         self.base_url_template = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+        self.models_url = "https://generativelanguage.googleapis.com/v1beta/models"
+        self._response_cache = OrderedDict()
+        # Models the API answered 404 for; later calls skip straight past them
+        self._unavailable_models = set()
+        self._response_cache_lock = threading.Lock()
+        if self.api_key:
+            # Open the upstream connection in the background so the first chat doesn't pay for it
+            threading.Thread(target=self.warm_up, daemon=True).start()
+
+    def warm_up(self) -> bool:
+        """Issue a cheap models.list call to pre-establish a pooled connection"""
+        try:
+            response = _SESSION.get(
+                self.models_url,
+                params={'key': self.api_key, 'pageSize': 1},
+                timeout=10
+            )
+            return response.status_code == 200
+        except Exception:
+            return False
         
     def generate_response(self, prompt: str, context: str = "") -> Dict[str, Any]:
         """Generate AI response using Gemini API with fallback models"""
@@ -54,6 +98,14 @@ Keep responses natural and direct, focusing on insights that matter."""
         else:
             full_prompt = f"{system_prompt}\n\nUser: {prompt}"
         
+        # Identical prompts (e.g. explaining the same cached analysis again) skip the round-trip
+        cache_key = hashlib.blake2b(f"{self.models[0]}\0{full_prompt}".encode(), digest_size=16).digest()
+        with self._response_cache_lock:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                return dict(cached)
+        
         payload = {
             "contents": [{
                 "parts": [{"text": full_prompt}]
@@ -68,12 +120,14 @@ Keep responses natural and direct, focusing on insights that matter."""
             }
         }
         
-        # Try each model in the fallback hierarchy
+        # Try each model in the fallback hierarchy, known-missing ones last
         last_error = None
-        for model in self.models:
+        candidates = ([m for m in self.models if m not in self._unavailable_models]
+                      + [m for m in self.models if m in self._unavailable_models])
+        for model in candidates:
             try:
                 base_url = self.base_url_template.format(model=model)
-                response = requests.post(
+                response = _SESSION.post(
                     f"{base_url}?key={self.api_key}",
                     headers=headers,
                     json=payload,
@@ -93,7 +147,13 @@ Keep responses natural and direct, focusing on insights that matter."""
                         
                         # Update current model on success
                         self.current_model = model
-                        return {"response": text, "status": "success", "model": model}
+                        self._unavailable_models.discard(model)
+                        result = {"response": text, "status": "success", "model": model}
+                        with self._response_cache_lock:
+                            self._response_cache[cache_key] = result
+                            if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                                self._response_cache.popitem(last=False)
+                        return dict(result)
                     else:
                         last_error = {"error": "No candidates returned", "upstream": True, "raw": data}
                         continue
@@ -111,6 +171,8 @@ Keep responses natural and direct, focusing on insights that matter."""
                         return {"error": "API key not valid. Please pass a valid API key.", "upstream": True}
                     
                     # For model-specific errors, try next model
+                    if response.status_code == 404:
+                        self._unavailable_models.add(model)
                     if response.status_code in [400, 404]:
                         last_error = {"error": f"Model {model} failed: {response.status_code} {err_text}", "upstream": True}
                         continue
@@ -145,45 +207,55 @@ Respond in JSON format with keys: analysis_type, columns, chart_type, explanatio
     def explain_insights(self, analysis_results: Dict[str, Any]) -> str:
         """Generate human-readable explanation of data analysis results"""
         context = f"""Explain these data analysis results in simple, engaging language:
-{json.dumps(analysis_results, indent=2)}
+{self._dump_results(analysis_results)}
 
 Provide key insights and what they mean for the user."""
         
         result = self.generate_response(context)
         return result.get('response', 'Unable to generate explanation')
     
+    @staticmethod
+    def _dump_results(analysis_results: Dict[str, Any]) -> str:
+        """Indented JSON of an analysis result for the prompt; orjson encodes numpy values natively"""
+        if orjson is not None:
+            try:
+                return orjson.dumps(analysis_results, default=str, option=orjson.OPT_INDENT_2
+                                    | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                pass
+        return json.dumps(analysis_results, indent=2, default=str)
+
     def _clean_response(self, text: str) -> str:
         """Clean up response text to remove unwanted formatting"""
-        import re
-        
         # Remove markdown-style formatting
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # Remove **bold**
-        text = re.sub(r'\*(.*?)\*', r'\1', text)      # Remove *italic*
+        text = _BOLD_RE.sub(r'\1', text)    # Remove **bold**
+        text = _ITALIC_RE.sub(r'\1', text)  # Remove *italic*
         
-        # Remove option listings if they appear
         lines = text.split('\n')
-        cleaned_lines = []
-        skip_section = False
-        
-        for line in lines:
-            line = line.strip()
-            # Skip sections that look like option listings
-            if re.match(r'^\*\*Option \d+', line) or line.startswith('**Option'):
-                skip_section = True
-                continue
-            elif re.match(r'^\*\*\w+:', line):  # Other ** formatted headers
-                skip_section = True
-                continue
-            elif skip_section and (line == '' or not line.startswith('**')):
-                skip_section = False
-                if line:  # Don't add empty lines
+        if '**' not in text:
+            # No line can start an option listing; only the per-line strip applies
+            cleaned_lines = [line.strip() for line in lines]
+        else:
+            # Remove option listings if they appear
+            cleaned_lines = []
+            skip_section = False
+            
+            for line in lines:
+                line = line.strip()
+                # Skip sections that look like option listings or other ** formatted headers
+                if _OPTION_HEADER_RE.match(line):
+                    skip_section = True
+                    continue
+                elif skip_section and (line == '' or not line.startswith('**')):
+                    skip_section = False
+                    if line:  # Don't add empty lines
+                        cleaned_lines.append(line)
+                elif not skip_section:
                     cleaned_lines.append(line)
-            elif not skip_section:
-                cleaned_lines.append(line)
         
         # Join back and clean up extra whitespace
         cleaned_text = '\n'.join(cleaned_lines).strip()
-        cleaned_text = re.sub(r'\n\s*\n\s*\n', '\n\n', cleaned_text)  # Remove multiple blank lines
+        cleaned_text = _EXTRA_BLANKS_RE.sub('\n\n', cleaned_text)  # Remove multiple blank lines
         
         return cleaned_text
     
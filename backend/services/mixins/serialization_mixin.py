@@ -1,23 +1,57 @@
 import numpy as np
 from pandas import Timestamp
 
+try:
+    import orjson
+except ImportError:  # the recursive walk below handles everything on its own
+    orjson = None
+
 class SerializationMixin:
     def _json_safe(self, obj):
+        """Convert numpy/pandas types to native Python for JSON serialization.
+
+        With orjson installed the whole structure is round-tripped through it,
+        which recognises numpy scalars and arrays in C; the recursive walk is
+        only used without orjson or for keys orjson can't encode (e.g. numpy
+        integers from a value_counts index).
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(orjson.dumps(obj, default=self._orjson_default,
+                                                 option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
+            except TypeError:
+                pass
+        return self._json_safe_walk(obj)
+
+    @staticmethod
+    def _orjson_default(obj):
+        """Values orjson doesn't encode natively, converted as _json_safe_walk would"""
+        if isinstance(obj, Timestamp):
+            return obj.isoformat()
+        if isinstance(obj, set):
+            return list(obj)
+        if hasattr(obj, 'item') and not isinstance(obj, np.ndarray):  # numpy scalars outside orjson's set
+            return obj.item()
+        if isinstance(obj, np.ndarray):  # non-contiguous or object arrays
+            return obj.tolist()
+        return str(obj)
+
+    def _json_safe_walk(self, obj):
         """Recursively convert numpy/pandas types to native Python for JSON serialization."""
         if isinstance(obj, (str, int, float, bool)) or obj is None:
             return obj
-        if isinstance(obj, (np.bool_, )):
-            return bool(obj)
-        if isinstance(obj, (np.integer, )):
-            return int(obj)
-        if isinstance(obj, (np.floating, )):
-            return float(obj)
-        if isinstance(obj, Timestamp):
-            return obj.isoformat()
         if isinstance(obj, dict):
-            return {str(self._json_safe(k)): self._json_safe(v) for k, v in obj.items()}
+            return {str(self._json_safe_walk(k)): self._json_safe_walk(v) for k, v in obj.items()}
         if isinstance(obj, (list, tuple, set)):
-            return [self._json_safe(v) for v in obj]
+            return [self._json_safe_walk(v) for v in obj]
+        if isinstance(obj, (np.bool_, np.integer, np.floating)):
+            return obj.item()
+        if isinstance(obj, np.ndarray):
+            if obj.dtype.kind in 'biuf':  # tolist() yields native scalars for the whole array in C
+                return obj.tolist()
+            return [self._json_safe_walk(v) for v in obj]
+        if isinstance(obj, Timestamp):
+            return obj.isoformat()
         try:
             if isinstance(obj, (np.dtype,)):
                 return str(obj)
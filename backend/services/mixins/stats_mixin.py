@@ -3,14 +3,41 @@ import pandas as pd
 
 class StatsMixin:
     def _distribution_summary(self, series: pd.Series):
-        series = series.dropna()
-        if series.empty:
+        """Mean/std/min/max and bias-corrected skew/kurtosis, as the Series methods give.
+
+        All six come from one float array: min/max/mean are single reductions
+        and the higher moments share one centred copy, instead of six pandas
+        reductions each re-validating and re-scanning the Series.
+        """
+        a = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        a = a[~np.isnan(a)]
+        n = a.size
+        if n == 0:
             return {}
+        mean = a.mean()
+        d = a - mean
+        d2 = d * d
+        m2 = d2.sum()
+        m3 = (d2 * d).sum()
+        m4 = (d2 * d2).sum()
+        if abs(m2) < 1e-14:  # constant series; pandas zeroes the same float error
+            m2 = 0.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+            if n < 3:
+                skew = np.nan
+            else:
+                skew = 0.0 if m2 == 0 else np.sqrt(n * (n - 1)) / (n - 2) * (m3 / n) / (m2 / n) ** 1.5
+            if n < 4:
+                kurt = np.nan
+            else:
+                kurt = 0.0 if m2 == 0 else (n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2)
+                                            - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
         return {
-            'mean': float(series.mean()),
-            'std': float(series.std()),
-            'min': float(series.min()),
-            'max': float(series.max()),
-            'skew': float(series.skew()),
-            'kurtosis': float(series.kurtosis())
+            'mean': float(mean),
+            'std': float(std),
+            'min': float(a.min()),
+            'max': float(a.max()),
+            'skew': float(skew),
+            'kurtosis': float(kurt)
         }
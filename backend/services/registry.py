@@ -0,0 +1,26 @@
+"""Process-wide service instances shared by all blueprints.
+
+Each getter builds its service on first call and returns the same object
+afterwards, so there is exactly one DataService (and therefore one loaded
+dataset), one GeminiService and one TTSService per process. Imports are
+deferred so heavy dependencies load only when a service is first needed.
+"""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_data_service():
+    from services.data_service import DataService
+    return DataService()
+
+
+@lru_cache(maxsize=1)
+def get_gemini_service():
+    from services.gemini_service import GeminiService
+    return GeminiService()
+
+
+@lru_cache(maxsize=1)
+def get_tts_service():
+    from services.tts_service import TTSService
+    return TTSService()
@@ -1,28 +1,73 @@
 import os
-import uuid
+import re
+import time
+import hashlib
+import threading
 from gtts import gTTS
-import pygame
 from io import BytesIO
 import tempfile
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+# Sentence boundaries generate_speech splits long replies at
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+_SPEAKABLE_RE = re.compile(r'\w')
 
 class TTSService:
-    def __init__(self, static_dir: str = 'static'):
+    # Audio unused for longer than this is removed by the background cleanup loop
+    AUDIO_MAX_AGE_HOURS = 24
+    # Optional cap on total audio bytes kept (0 = no cap); least recently used go first
+    AUDIO_MAX_BYTES = int(os.getenv('TTS_AUDIO_MAX_BYTES', 0))
+
+    def __init__(self, static_dir: str = 'static', concurrency: int = 3):
         self.static_dir = static_dir
-        pygame.mixer.init()
+        # Bounds how many gTTS round-trips generate_speech_batch keeps in flight
+        self._batch_pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='tts')
+        # Sentence chunks of one utterance; separate from the batch pool so a
+        # batch item never waits on work queued behind itself
+        self._chunk_pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='tts-chunk')
+        # (static_dir mtime, oldest kept audio mtime, kept audio bytes) after the last cleanup pass
+        self._cleanup_state = (None, 0.0, 0)
+        # Expired audio is removed off the request path, a few times per max age
+        self._stop_cleanup = threading.Event()
+        threading.Thread(target=self._cleanup_loop, daemon=True).start()
         
     def generate_speech(self, text: str, lang: str = 'en') -> Optional[str]:
-        """Generate speech from text and return audio file path"""
+        """Generate speech from text and return audio file path.
+
+        Files are named after a hash of (lang, text), so repeating an
+        utterance that is still on disk returns the existing file without
+        calling Google again. Multi-sentence text is synthesized one sentence
+        per request, concurrently; MP3 frames concatenate, so the parts are
+        joined in order into one file (gTTS joins its own chunks the same way).
+        """
         try:
-            # Create gTTS object
-            tts = gTTS(text=text, lang=lang, slow=False)
-            
-            # Generate filename
-            filename = f"speech_{uuid.uuid4().hex[:8]}.mp3"
+            key = hashlib.blake2b(f"{lang}|{text}".encode(), digest_size=8).hexdigest()
+            filename = f"speech_{key}.mp3"
             filepath = os.path.join(self.static_dir, filename)
+            try:
+                os.utime(filepath)  # already on disk: mark as recently used for cleanup_old_files
+                return filename
+            except FileNotFoundError:
+                pass
             
-            # Save audio file
-            tts.save(filepath)
+            # Punctuation-only pieces ('...') have nothing to speak; gTTS rejects them
+            sentences = [s for s in _SENTENCE_END_RE.split(text.strip()) if _SPEAKABLE_RE.search(s)]
+            if len(sentences) > 1:
+                audio = b''.join(self._chunk_pool.map(lambda s: self._synthesize(s, lang), sentences))
+            else:
+                audio = self._synthesize(text, lang)
+            
+            # Save under a temporary name and rename into place, so a
+            # concurrent request for the same text never serves a partial file
+            fd, tmp_path = tempfile.mkstemp(suffix='.mp3', dir=self.static_dir)
+            try:
+                with os.fdopen(fd, 'wb') as fp:
+                    fp.write(audio)
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
             
             return filename
             
@@ -30,33 +75,105 @@ class TTSService:
             print(f"TTS Error: {str(e)}")
             return None
     
+    @staticmethod
+    def _synthesize(text: str, lang: str) -> bytes:
+        """MP3 bytes for text from gTTS"""
+        buf = BytesIO()
+        gTTS(text=text, lang=lang, slow=False).write_to_fp(buf)
+        return buf.getvalue()
+    
+    def generate_speech_batch(self, texts: List[str], lang: str = 'en') -> List[Optional[str]]:
+        """Generate several utterances concurrently; filenames come back in input order.
+
+        Up to `concurrency` requests to Google overlap, so N utterances cost
+        about ceil(N / concurrency) round-trips instead of N. Entries are None
+        where generation failed, as with generate_speech.
+        """
+        return list(self._batch_pool.map(lambda text: self.generate_speech(text, lang), texts))
+    
+    @staticmethod
+    def _mixer():
+        """pygame's mixer, imported and opened on first local playback.
+
+        The server only writes files for the browser to fetch from /static, so
+        it never loads SDL or holds an audio device.
+        """
+        import pygame
+        # Match gTTS output (24 kHz mono) so the mixer doesn't resample, with a
+        # larger buffer than the default against underruns under load
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(frequency=24000, size=-16, channels=1, buffer=4096)
+        return pygame.mixer
+    
     def play_audio(self, audio_path: str) -> bool:
-        """Play audio file using pygame"""
+        """Play audio file locally using pygame (CLI use; the web client plays audio_url itself)"""
         try:
             full_path = os.path.join(self.static_dir, audio_path)
             if os.path.exists(full_path):
-                pygame.mixer.music.load(full_path)
-                pygame.mixer.music.play()
+                mixer = self._mixer()
+                mixer.music.load(full_path)
+                mixer.music.play()
                 return True
             return False
         except Exception as e:
             print(f"Audio playback error: {str(e)}")
             return False
     
-    def cleanup_old_files(self, max_age_hours: int = 24):
-        """Clean up old audio files to save disk space"""
+    def cleanup_old_files(self, max_age_hours: int = 24, max_bytes: Optional[int] = None):
+        """Clean up old audio files to save disk space.
+
+        Files unused for more than max_age_hours are removed; with max_bytes,
+        the least recently used of the rest are then removed until the audio
+        fits. A cache hit in generate_speech refreshes a file's mtime, so
+        mtime order is use order.
+
+        If no file was added or removed since the last pass (directory mtime
+        unchanged), the oldest file kept then is still within max_age_hours and
+        the kept audio fits max_bytes, nothing can be due and the scan is skipped.
+        """
         try:
-            import time
             current_time = time.time()
+            max_age = max_age_hours * 3600
+            last_mtime, oldest_kept, kept_bytes = self._cleanup_state
+            if (os.stat(self.static_dir).st_mtime_ns == last_mtime and current_time - oldest_kept <= max_age
+                    and (not max_bytes or kept_bytes <= max_bytes)):
+                return
             
-            for filename in os.listdir(self.static_dir):
-                if filename.endswith('.mp3') or filename.endswith('.wav'):
-                    filepath = os.path.join(self.static_dir, filename)
-                    file_age = current_time - os.path.getctime(filepath)
-                    
-                    # Delete files older than max_age_hours
-                    if file_age > max_age_hours * 3600:
-                        os.remove(filepath)
+            kept = []  # (mtime, size, path); one stat per file
+            with os.scandir(self.static_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.mp3', '.wav')):
+                        st = entry.stat(follow_symlinks=False)
+                        
+                        # Delete files older than max_age_hours
+                        if current_time - st.st_mtime > max_age:
+                            os.remove(entry.path)
+                        else:
+                            kept.append((st.st_mtime, st.st_size, entry.path))
+            
+            kept.sort()
+            kept_bytes = sum(size for _, size, _ in kept)
+            evicted = 0
+            if max_bytes:
+                while evicted < len(kept) and kept_bytes > max_bytes:
+                    _, size, path = kept[evicted]
+                    os.remove(path)
+                    kept_bytes -= size
+                    evicted += 1
+            oldest_kept = kept[evicted][0] if evicted < len(kept) else current_time
+            self._cleanup_state = (os.stat(self.static_dir).st_mtime_ns, oldest_kept, kept_bytes)
                         
         except Exception as e:
             print(f"Cleanup error: {str(e)}")
+    
+    def _cleanup_loop(self):
+        """Run cleanup_old_files now and every AUDIO_MAX_AGE_HOURS / 4 until stop_cleanup()"""
+        interval = self.AUDIO_MAX_AGE_HOURS * 3600 / 4
+        while True:
+            self.cleanup_old_files(self.AUDIO_MAX_AGE_HOURS, self.AUDIO_MAX_BYTES)
+            if self._stop_cleanup.wait(interval):
+                return
+    
+    def stop_cleanup(self):
+        """Stop the background cleanup loop (e.g. on shutdown)"""
+        self._stop_cleanup.set()
@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+
+from services.data_service import DataService
+
+
+@pytest.fixture
+def load(tmp_path):
+    """Load a frame through DataService.load_data and return the service"""
+    def _load(frame):
+        path = tmp_path / 'data.csv'
+        frame.to_csv(path, index=False)
+        service = DataService(static_dir=str(tmp_path))
+        result = service.load_data(str(path), 'csv')
+        assert 'error' not in result
+        return service
+    return _load
+
+
+def test_unmatched_dataset_is_described_as_plain_records(load):
+    service = load(pd.DataFrame({
+        'name': [f'n{i}' for i in range(20)],
+        'group': ['a', 'b'] * 10,
+        'score': range(20),
+    }))
+    summary = service.get_brief_summary()
+    assert summary.startswith("This dataset contains 20 records across 3 columns.")
+    assert "general data" not in summary
+
+
+def test_dataset_type_names_the_records(load):
+    service = load(pd.DataFrame({
+        'region': ['north', 'south'] * 10,
+        'sales': range(20),
+    }))
+    assert service.get_brief_summary().startswith("This dataset contains 20 sales records across 2 columns.")
+
+
+def test_summary_lists_metrics_and_dimensions(load):
+    service = load(pd.DataFrame({
+        'region': ['north', 'south', 'east', 'west'] * 5,
+        'price': [float(i) for i in range(20)],
+    }))
+    summary = service.get_brief_summary()
+    assert "Key metrics include price" in summary
+    assert "analyzed across region" in summary
+
+
+def test_summary_reports_missing_values(load):
+    service = load(pd.DataFrame({
+        'group': ['a', 'b'] * 10,
+        'score': [None] + list(range(19)),
+    }))
+    assert "Note: " in service.get_brief_summary()
+    assert "1 columns have missing values" in service.get_brief_summary()
+
+
+def test_associated_categories_are_scored(load):
+    service = load(pd.DataFrame({
+        'colour': ['red', 'blue'] * 10,
+        'shade': ['warm', 'cool'] * 10,
+        'label': [f'l{i}' for i in range(20)],  # near-unique: never paired
+    }))
+    associations = service._categorical_associations(0.5)
+    assert [a['columns'] for a in associations] == [['colour', 'shade']]
+    assert associations[0]['cramers_v'] == pytest.approx(1.0)
@@ -80,6 +80,22 @@ const QueryResults = ({ results }) => {
   )
 };
 
+// Upload returns only the first preview_rows rows; client-side charts are
+// built from those, so say so when the file is larger
+const PreviewNotice = ({ datasetInfo }) => {
+  const previewRows = datasetInfo?.preview_rows
+  const totalRows = datasetInfo?.total_rows
+  if (!previewRows || !totalRows || previewRows >= totalRows) return null
+  return (
+    <div className="flex items-center space-x-2 text-sm text-yellow-400 mb-4">
+      <AlertCircle className="w-4 h-4" />
+      <span>
+        Preview: based on the first {previewRows.toLocaleString()} of {totalRows.toLocaleString()} rows
+      </span>
+    </div>
+  )
+}
+
 const DatasetStats = ({ datasetInfo }) => (
   <div className="grid grid-cols-3 gap-4">
     <div className="bg-slate-800/50 rounded-lg p-4 text-center border border-white/10">
@@ -515,6 +531,7 @@ const DataDashboard = ({ onDatasetLoaded }) => {
             )}
             {activeTab === 'visualizations' && (
               <ErrorBoundary>
+                <PreviewNotice datasetInfo={datasetInfo} />
                 <DataVisualizer 
                   data={datasetInfo?.data || []}
                   columns={datasetInfo?.columns || []}
@@ -531,6 +548,7 @@ const DataDashboard = ({ onDatasetLoaded }) => {
             )}
             {activeTab === 'statistics' && (
               <ErrorBoundary>
+                <PreviewNotice datasetInfo={datasetInfo} />
                 <StatisticalInsights 
                   data={datasetInfo?.data || []}
                   columns={datasetInfo?.columns || []}
@@ -541,6 +559,7 @@ const DataDashboard = ({ onDatasetLoaded }) => {
             )}
             {activeTab === 'correlations' && (
               <ErrorBoundary>
+                <PreviewNotice datasetInfo={datasetInfo} />
                 <CorrelationMatrix
                   data={datasetInfo?.data || []}
                   columnTypes={datasetInfo?.column_types || {}}